@@ -7,7 +7,12 @@ Automates the manual steps:
 3. In Security-Adm, set up organisation-wide analyzer for unused access (main region only)
 """
 
-from .utils import printc, get_client, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import printc, get_client, check_regions_in_parallel, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+
+# Upper bound on analyzers whose findings are counted concurrently
+MAX_ANALYZER_WORKERS = 8
 
 def setup_access_analyzer(enabled, params, dry_run, verbose):
     """Setup IAM Access Analyzer delegation and organization-wide analyzers."""
@@ -135,12 +140,14 @@ def setup_access_analyzer(enabled, params, dry_run, verbose):
         
         # Step 3: Check analyzer presence in expected regions
         analyzer_status = {}
-        for region in regions:
+        
+        def check_region(region):
             if verbose:
                 printc(GRAY, f"\n Checking analyzers in region {region}...")
-            
             is_main_region = (region == main_region)
-            region_status = check_access_analyzer_in_region(region, admin_account, security_account, cross_account_role, is_main_region, delegation_status, verbose)
+            return check_access_analyzer_in_region(region, admin_account, security_account, cross_account_role, is_main_region, delegation_status, verbose)
+        
+        for region, region_status in check_regions_in_parallel(check_region, regions).items():
             analyzer_status[region] = region_status
             
             if not region_status['needs_changes']:
@@ -335,60 +342,64 @@ def check_access_analyzer_in_region(region, admin_account, security_account, cro
         status['unused_analyzer_count'] = 0
     
     try:
-        # Check for analyzers in this region (from admin account perspective first)
-        try:
-            analyzer_client = get_client('accessanalyzer', admin_account, region, 'AWSControlTowerExecution')
-            all_analyzers = []
-            paginator = analyzer_client.get_paginator('list_analyzers')
-            for page in paginator.paginate():
-                all_analyzers.extend(page.get('analyzers', []))
-            
-            if all_analyzers:
-                status['service_enabled'] = True
-                status['service_details'].append(f"✅ Found {len(all_analyzers)} analyzer(s) in {region}")
+        # The delegated admin view is authoritative for organization analyzers,
+        # so only list the admin account's own analyzers when it won't be used
+        use_delegated_view = (delegation_status == 'delegated' and 
+                              cross_account_role and 
+                              security_account != admin_account)
+        
+        # Create cross-account client to security account
+        delegated_client = None
+        if use_delegated_view:
+            delegated_client = get_client('accessanalyzer', security_account, region, cross_account_role)
+        
+        # Fall back to the admin account's analyzers when the delegated view is unavailable
+        if not delegated_client:
+            try:
+                analyzer_client = get_client('accessanalyzer', admin_account, region, cross_account_role)
+                all_analyzers = []
+                paginator = analyzer_client.get_paginator('list_analyzers')
+                for page in paginator.paginate():
+                    all_analyzers.extend(page.get('analyzers', []))
                 
-                # Analyze each analyzer
-                for analyzer in all_analyzers:
-                    analyzer_name = analyzer.get('name')
-                    analyzer_type = analyzer.get('type')
-                    analyzer_status = analyzer.get('status')
-                    
-                    status['service_details'].append(f"    Analyzer '{analyzer_name}':")
-                    status['service_details'].append(f"      Type: {analyzer_type}")
-                    status['service_details'].append(f"      Status: {analyzer_status}")
+                if all_analyzers:
+                    status['service_enabled'] = True
+                    status['service_details'].append(f"✅ Found {len(all_analyzers)} analyzer(s) in {region}")
                     
-                    # Classify analyzer types based on naming and configuration
-                    if 'external' in analyzer_name.lower() or analyzer_type == 'ORGANIZATION':
-                        status['external_analyzer_count'] += 1
-                        status['service_details'].append(f"       External Access Analyzer")
-                    elif 'unused' in analyzer_name.lower():
-                        status['unused_analyzer_count'] += 1
-                        status['service_details'].append(f"      📊 Unused Access Analyzer")
-                    else:
-                        # Generic analyzer - assume external access for now
-                        status['external_analyzer_count'] += 1
-                        status['service_details'].append(f"       General Analyzer (assuming external access)")
-            else:
-                # Only show this if delegation isn't going to provide better data
-                if delegation_status != 'delegated':
+                    # Analyze each analyzer
+                    for analyzer in all_analyzers:
+                        analyzer_name = analyzer.get('name')
+                        analyzer_type = analyzer.get('type')
+                        analyzer_status = analyzer.get('status')
+                        
+                        status['service_details'].append(f"    Analyzer '{analyzer_name}':")
+                        status['service_details'].append(f"      Type: {analyzer_type}")
+                        status['service_details'].append(f"      Status: {analyzer_status}")
+                        
+                        # Classify analyzer types based on naming and configuration
+                        if 'external' in analyzer_name.lower() or analyzer_type == 'ORGANIZATION':
+                            status['external_analyzer_count'] += 1
+                            status['service_details'].append(f"       External Access Analyzer")
+                        elif 'unused' in analyzer_name.lower():
+                            status['unused_analyzer_count'] += 1
+                            status['service_details'].append(f"      📊 Unused Access Analyzer")
+                        else:
+                            # Generic analyzer - assume external access for now
+                            status['external_analyzer_count'] += 1
+                            status['service_details'].append(f"       General Analyzer (assuming external access)")
+                else:
                     status['service_details'].append(f"❌ No analyzers found in {region}")
-                    
-        except ClientError as e:
-            error_msg = f"List analyzers failed: {str(e)}"
-            status['errors'].append(error_msg)
-            status['service_details'].append(f"❌ List analyzers failed: {str(e)}")
+                        
+            except ClientError as e:
+                error_msg = f"List analyzers failed: {str(e)}"
+                status['errors'].append(error_msg)
+                status['service_details'].append(f"❌ List analyzers failed: {str(e)}")
         
         # If delegated to security account, get comprehensive data from delegated admin perspective
-        if (delegation_status == 'delegated' and 
-            cross_account_role and 
-            security_account != admin_account):
-            
+        if use_delegated_view:
             if verbose:
                 printc(GRAY, f"     Checking from delegated admin perspective...")
             
-            # Create cross-account client to security account
-            delegated_client = get_client('accessanalyzer', security_account, region, cross_account_role)
-            
             if delegated_client:
                 try:
                     # Get analyzers from delegated admin perspective
@@ -405,7 +416,10 @@ def check_access_analyzer_in_region(region, admin_account, security_account, cro
                         status['unused_analyzer_count'] = 0
                         status['service_enabled'] = True
                         
-                        for analyzer in all_delegated_analyzers:
+                        # Count findings for all analyzers at once; read back in order below
+                        findings_futures = fetch_active_findings_counts(delegated_client, all_delegated_analyzers)
+                        
+                        for analyzer, findings_future in zip(all_delegated_analyzers, findings_futures):
                             analyzer_name = analyzer.get('name')
                             analyzer_type = analyzer.get('type')
                             analyzer_status = analyzer.get('status')
@@ -427,25 +441,20 @@ def check_access_analyzer_in_region(region, admin_account, security_account, cro
                             
                             # Get findings count for this analyzer
                             try:
-                                findings_count = 0
                                 analyzer_type = analyzer.get('type')
                                 
                                 # Use appropriate API based on analyzer type
                                 if analyzer_type == 'ORGANIZATION_UNUSED_ACCESS':
                                     # Use ListFindingsV2 for Unused Access analyzers
                                     try:
-                                        findings_paginator = delegated_client.get_paginator('list_findings_v2')
-                                        for page in findings_paginator.paginate(analyzerArn=analyzer.get('arn')):
-                                            findings_count += len(page.get('findings', []))
+                                        findings_count = findings_future.result()
                                     except Exception:
                                         # Fallback: Skip findings count for unused access analyzers
                                         status['service_details'].append(f"       Findings: (Unused Access - count not available)")
                                         continue
                                 else:
                                     # Use ListFindings for External Access analyzers
-                                    findings_paginator = delegated_client.get_paginator('list_findings')
-                                    for page in findings_paginator.paginate(analyzerArn=analyzer.get('arn')):
-                                        findings_count += len(page.get('findings', []))
+                                    findings_count = findings_future.result()
                                 
                                 if findings_count > 0:
                                     status['service_details'].append(f"       Active Findings: {findings_count}")
@@ -502,3 +511,45 @@ def check_access_analyzer_in_region(region, admin_account, security_account, cro
     
     return status
 
+def count_active_findings(analyzer_client, analyzer_arn, list_operation):
+    """
+    Count the active findings of an analyzer without downloading them.
+    
+    GetFindingsStatistics returns the totals in a single call. boto3 releases
+    that predate it fall back to paging through the active findings with
+    list_operation, keeping only a running count.
+    """
+    get_findings_statistics = getattr(analyzer_client, 'get_findings_statistics', None)
+    if get_findings_statistics:
+        response = get_findings_statistics(analyzerArn=analyzer_arn)
+        # Each entry holds the statistics for one finding type
+        return sum(
+            statistics.get('totalActiveFindings', 0)
+            for entry in response.get('findingsStatistics', [])
+            for statistics in entry.values()
+        )
+    
+    findings_paginator = analyzer_client.get_paginator(list_operation)
+    return sum(
+        len(page.get('findings', []))
+        for page in findings_paginator.paginate(analyzerArn=analyzer_arn, filter={'status': {'eq': ['ACTIVE']}})
+    )
+
+def fetch_active_findings_counts(analyzer_client, analyzers):
+    """
+    Count the active findings of every analyzer concurrently.
+    
+    Unused access analyzers need ListFindingsV2; the others use ListFindings.
+    Returns one completed Future per analyzer, in the same order. Calling
+    result() returns the count or re-raises that analyzer's error.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(analyzers), MAX_ANALYZER_WORKERS)) as executor:
+        return [
+            executor.submit(
+                count_active_findings,
+                analyzer_client,
+                analyzer.get('arn'),
+                'list_findings_v2' if analyzer.get('type') == 'ORGANIZATION_UNUSED_ACCESS' else 'list_findings'
+            )
+            for analyzer in analyzers
+        ]
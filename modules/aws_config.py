@@ -8,7 +8,7 @@ Automates the manual steps:
    global filter in these regions.
 """
 
-from .utils import printc, get_client, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from .utils import printc, get_client, check_regions_in_parallel, iter_paginated, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
 
 def setup_aws_config(enabled, params, dry_run, verbose):
     """Setup AWS Config in org account with proper IAM global event recording."""
@@ -105,11 +105,12 @@ def setup_aws_config(enabled, params, dry_run, verbose):
         config_status = {}
         any_changes_needed = False
         
-        for region in regions:
+        def check_region(region):
             if verbose:
                 printc(GRAY, f"\nChecking Config in region {region}...")
-            
-            region_status = check_config_in_region(region, main_region == region, admin_account, cross_account_role, verbose)
+            return check_config_in_region(region, main_region == region, admin_account, cross_account_role, verbose)
+        
+        for region, region_status in check_regions_in_parallel(check_region, regions).items():
             config_status[region] = region_status
             
             if not region_status['needs_changes']:
@@ -328,19 +329,19 @@ def check_config_in_region(region, is_main_region, admin_account, cross_account_
         
         # Check Config rules count with pagination
         try:
-            all_rules = []
+            rules_count = 0
+            aws_managed = 0
             paginator = config_client.get_paginator('describe_config_rules')
             
-            for page in paginator.paginate():
-                rules = page.get('ConfigRules', [])
-                all_rules.extend(rules)
+            # Count and categorize rules by source as the pages arrive
+            for rule in iter_paginated(paginator, 'ConfigRules'):
+                rules_count += 1
+                if rule.get('Source', {}).get('Owner') == 'AWS':
+                    aws_managed += 1
             
-            rules_count = len(all_rules)
             status['service_details'].append(f"✅ Config Rules: {rules_count} active rules")
             
             if rules_count > 0:
-                # Categorize rules by source
-                aws_managed = sum(1 for rule in all_rules if rule.get('Source', {}).get('Owner') == 'AWS')
                 custom = rules_count - aws_managed
                 
                 if aws_managed > 0:
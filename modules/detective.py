@@ -7,7 +7,10 @@ Automates the manual steps:
 2. In Security-Adm, configure Detective in all your selected regions.
 """
 
-from .utils import printc, get_client, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils import printc, get_client, check_regions_in_parallel, iter_detective_graph_members, MAX_REGION_WORKERS, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
 
 def setup_detective(enabled, params, dry_run, verbose):
     """Setup Amazon Detective delegation and configuration with comprehensive discovery."""
@@ -43,11 +46,8 @@ def setup_detective(enabled, params, dry_run, verbose):
             try:
                 import boto3
                 from botocore.exceptions import ClientError
-                orgs_client = get_client('organizations', admin_account, regions[0], cross_account_role)
-                paginator = orgs_client.get_paginator('list_delegated_administrators')
-                detective_admins = []
-                for page in paginator.paginate(ServicePrincipal='detective.amazonaws.com'):
-                    detective_admins.extend(page.get('DelegatedAdministrators', []))
+                # Organizations is global, so use the shared us-east-1 lookup
+                detective_admins = DelegationChecker.list_delegated_admins('detective.amazonaws.com', admin_account, cross_account_role) or []
                 
                 if any(admin.get('Id') == security_account for admin in detective_admins):
                     detective_delegation_exists = True
@@ -73,9 +73,7 @@ def setup_detective(enabled, params, dry_run, verbose):
                             # Count members in graphs
                             for graph in graphs:
                                 try:
-                                    members_paginator = detective_client.get_paginator('list_members')
-                                    for page in members_paginator.paginate(GraphArn=graph.get('Arn')):
-                                        total_members += len(page.get('MemberDetails', []))
+                                    total_members += sum(1 for _ in iter_detective_graph_members(detective_client, graph.get('Arn')))
                                 except Exception:
                                     pass
                     except Exception:
@@ -190,11 +188,12 @@ def setup_detective(enabled, params, dry_run, verbose):
         detective_status = {}
         any_changes_needed = False
         
-        for region in regions:
+        def check_region(region):
             if verbose:
                 printc(GRAY, f"\n Checking Detective in region {region}...")
-            
-            region_status = check_detective_in_region(region, admin_account, security_account, cross_account_role, verbose)
+            return check_detective_in_region(region, admin_account, security_account, cross_account_role, verbose)
+        
+        for region, region_status in check_regions_in_parallel(check_region, regions).items():
             detective_status[region] = region_status
             
             if not region_status['needs_changes']:
@@ -453,6 +452,7 @@ def check_detective_in_region(region, admin_account, security_account, cross_acc
                 status['service_details'].append(f"✅ Detective Graph: {len(all_graphs)} found")
                 
                 # Check each graph for member details
+                graph_members = fetch_graph_members(detective_client, all_graphs)
                 for graph in all_graphs:
                     graph_arn = graph.get('Arn')
                     graph_created = graph.get('CreatedTime')
@@ -462,23 +462,20 @@ def check_detective_in_region(region, admin_account, security_account, cross_acc
                     
                     # Get member accounts for this graph
                     try:
-                        members_paginator = detective_client.get_paginator('list_members')
-                        all_members = []
-                        for page in members_paginator.paginate(GraphArn=graph_arn):
-                            all_members.extend(page.get('MemberDetails', []))
+                        status_counts = graph_members[graph_arn].result()
                         
-                        status['member_count'] = len(all_members)
-                        status['service_details'].append(f"      Members: {len(all_members)} accounts")
+                        status['member_count'] = sum(status_counts.values())
+                        status['service_details'].append(f"      Members: {status['member_count']} accounts")
                         
-                        if len(all_members) == 0:
+                        if status['member_count'] == 0:
                             status['needs_changes'] = True
                             status['issues'].append("Detective graph has no member accounts")
                             status['actions'].append("Add organization member accounts to Detective")
                             status['actions'].append("Enable auto-enrollment for new accounts")
                         else:
                             # Show member summary
-                            invited_count = sum(1 for member in all_members if member.get('Status') == 'INVITED')
-                            enabled_count = sum(1 for member in all_members if member.get('Status') == 'ENABLED')
+                            invited_count = status_counts['INVITED']
+                            enabled_count = status_counts['ENABLED']
                             
                             if invited_count > 0:
                                 status['service_details'].append(f"      Pending Invitations: {invited_count}")
@@ -529,27 +526,22 @@ def check_detective_in_region(region, admin_account, security_account, cross_acc
                         # Update from delegated admin perspective (more authoritative)
                         status['service_enabled'] = True
                         
+                        delegated_graph_members = fetch_graph_members(delegated_client, all_delegated_graphs)
                         for graph in all_delegated_graphs:
                             graph_arn = graph.get('Arn')
                             status['service_details'].append(f"    Delegated Graph: {graph_arn}")
                             
                             # Get comprehensive member data from delegated admin
                             try:
-                                members_paginator = delegated_client.get_paginator('list_members')
-                                all_members = []
-                                for page in members_paginator.paginate(GraphArn=graph_arn):
-                                    all_members.extend(page.get('MemberDetails', []))
+                                status_counts = delegated_graph_members[graph_arn].result()
                                 
-                                status['member_count'] = len(all_members)
+                                status['member_count'] = sum(status_counts.values())
                                 
-                                if len(all_members) > 0:
-                                    enabled_members = [m for m in all_members if m.get('Status') == 'ENABLED']
-                                    invited_members = [m for m in all_members if m.get('Status') == 'INVITED']
-                                    
-                                    status['service_details'].append(f"       Total Members: {len(all_members)}")
-                                    status['service_details'].append(f"      ✅ Active Members: {len(enabled_members)}")
-                                    if invited_members:
-                                        status['service_details'].append(f"       Pending Invitations: {len(invited_members)}")
+                                if status['member_count'] > 0:
+                                    status['service_details'].append(f"       Total Members: {status['member_count']}")
+                                    status['service_details'].append(f"      ✅ Active Members: {status_counts['ENABLED']}")
+                                    if status_counts['INVITED']:
+                                        status['service_details'].append(f"       Pending Invitations: {status_counts['INVITED']}")
                                 else:
                                     status['service_details'].append(f"      ❌ No member accounts found")
                                     
@@ -571,3 +563,20 @@ def check_detective_in_region(region, admin_account, security_account, cross_acc
     
     return status
 
+def fetch_graph_members(detective_client, graphs):
+    """
+    Tally the member statuses of every graph concurrently.
+    
+    Returns a dict of graph ARN to a completed Future. Calling result()
+    returns a Counter of that graph's member statuses or re-raises its
+    ClientError, so callers keep per-graph error handling.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(graphs), MAX_REGION_WORKERS)) as executor:
+        return {
+            graph.get('Arn'): executor.submit(count_graph_member_statuses, detective_client, graph.get('Arn'))
+            for graph in graphs
+        }
+
+def count_graph_member_statuses(detective_client, graph_arn):
+    """Count a graph's members by status as the pages arrive, without keeping them."""
+    return Counter(member.get('Status') for member in iter_detective_graph_members(detective_client, graph_arn))
@@ -7,7 +7,9 @@ Automates the manual steps:
 3. In the Security-Adm account, enable and configure GuardDuty auto-enable in all regions
 """
 
-from .utils import printc, get_client, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from collections import Counter
+
+from .utils import printc, get_client, check_regions_in_parallel, run_concurrently, iter_paginated, MEMBERS_PAGE_SIZE, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
 
 def setup_guardduty(enabled, params, dry_run, verbose):
     """Setup AWS GuardDuty with proper organization delegation."""
@@ -101,11 +103,12 @@ def setup_guardduty(enabled, params, dry_run, verbose):
         guardduty_status = {}
         any_changes_needed = False
         
-        for region in regions:
+        def check_region(region):
             if verbose:
                 printc(GRAY, f"\n Checking GuardDuty in region {region}...")
-            
-            region_status = check_guardduty_in_region(region, admin_account, security_account, cross_account_role, verbose)
+            return check_guardduty_in_region(region, admin_account, security_account, cross_account_role, verbose)
+        
+        for region, region_status in check_regions_in_parallel(check_region, regions).items():
             guardduty_status[region] = region_status
             
             if not region_status['needs_changes']:
@@ -223,6 +226,15 @@ def check_guardduty_in_region(region, admin_account, security_account, cross_acc
     try:
         guardduty_client = get_client('guardduty', admin_account, region, cross_account_role)
         
+        delegation_args = dict(
+            service_principal='guardduty.amazonaws.com',
+            admin_account=admin_account,
+            security_account=security_account,
+            cross_account_role=cross_account_role,
+            verbose=verbose
+        )
+        delegation_future = None
+        
         # Check GuardDuty detectors
         try:
             detectors_response = guardduty_client.list_detectors()
@@ -240,6 +252,9 @@ def check_guardduty_in_region(region, admin_account, security_account, cross_acc
             detector_id = detector_ids[0]  # Usually only one detector per region
             status['service_details'].append(f"✅ GuardDuty Detector: {detector_id}")
             
+            # Organizations is a separate endpoint, so check delegation while the detector is read
+            delegation_future = run_concurrently(DelegationChecker.check_service_delegation, **delegation_args)
+            
             # Get detector details
             try:
                 detector_response = guardduty_client.get_detector(DetectorId=detector_id)
@@ -285,13 +300,10 @@ def check_guardduty_in_region(region, admin_account, security_account, cross_acc
                 printc(RED, f"    ❌ {error_msg}")
                 
         # Check delegation using shared utility
-        delegation_result = DelegationChecker.check_service_delegation(
-            service_principal='guardduty.amazonaws.com',
-            admin_account=admin_account,
-            security_account=security_account,
-            cross_account_role=cross_account_role,
-            verbose=verbose
-        )
+        if delegation_future:
+            delegation_result = delegation_future.result()
+        else:
+            delegation_result = DelegationChecker.check_service_delegation(**delegation_args)
         
         is_delegated_to_security = delegation_result['is_delegated_to_security']
         
@@ -402,23 +414,24 @@ def check_guardduty_in_region(region, admin_account, security_account, cross_acc
                         
                         # Get member accounts from delegated admin with pagination
                         try:
-                            all_members = []
                             paginator = delegated_client.get_paginator('list_members')
                             
-                            for page in paginator.paginate(DetectorId=delegated_detector_id):
-                                members = page.get('Members', [])
-                                all_members.extend(members)
+                            # Tally relationship statuses as the pages arrive
+                            relationship_counts = Counter(
+                                member.get('RelationshipStatus')
+                                for member in iter_paginated(paginator, 'Members', DetectorId=delegated_detector_id, PaginationConfig={'PageSize': MEMBERS_PAGE_SIZE})
+                            )
                             
-                            status['member_count'] = len(all_members)
+                            status['member_count'] = sum(relationship_counts.values())
                             status['service_details'].append(f"✅ Member Accounts: {status['member_count']} found")
                             
                             # Analyze member statuses - detect weird configurations
                             if status['member_count'] > 0:
-                                enabled_members = sum(1 for member in all_members if member.get('RelationshipStatus') == 'Enabled')
-                                invited_members = sum(1 for member in all_members if member.get('RelationshipStatus') == 'Invited')
-                                disabled_members = sum(1 for member in all_members if member.get('RelationshipStatus') == 'Disabled')
-                                paused_members = sum(1 for member in all_members if member.get('RelationshipStatus') == 'Paused')
-                                removed_members = sum(1 for member in all_members if member.get('RelationshipStatus') == 'Removed')
+                                enabled_members = relationship_counts.get('Enabled', 0)
+                                invited_members = relationship_counts.get('Invited', 0)
+                                disabled_members = relationship_counts.get('Disabled', 0)
+                                paused_members = relationship_counts.get('Paused', 0)
+                                removed_members = relationship_counts.get('Removed', 0)
                                 
                                 # Case 4: Valid configuration - all members enabled
                                 if enabled_members == status['member_count']:
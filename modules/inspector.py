@@ -15,7 +15,9 @@ COST-CONSCIOUS APPROACH:
 - Client controls specific scan types (ECR, EC2, Lambda) based on needs
 """
 
-from .utils import printc, get_client, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from collections import Counter
+
+from .utils import printc, get_client, get_region_names, check_regions_in_parallel, run_concurrently, iter_paginated, MEMBERS_PAGE_SIZE, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
 
 def setup_inspector(enabled, params, dry_run, verbose):
     """Setup Amazon Inspector delegation and configuration with cost-conscious minimal approach."""
@@ -65,9 +67,10 @@ def setup_inspector(enabled, params, dry_run, verbose):
             # Inspector scanning can exist even without delegation, and we want to detect unexpected costs
             try:
                 import boto3
-                ec2_client = get_client('ec2', admin_account, regions[0] if regions else 'us-east-1', cross_account_role)
-                regions_response = ec2_client.describe_regions()
-                all_regions = [region['RegionName'] for region in regions_response['Regions']]
+                all_regions = get_region_names(
+                    admin_account,
+                    lambda: get_client('ec2', admin_account, regions[0] if regions else 'us-east-1', cross_account_role)
+                )
                 
                 if verbose:
                     printc(GRAY, f"    Checking all {len(all_regions)} AWS regions for spurious Inspector activation...")
@@ -87,22 +90,21 @@ def setup_inspector(enabled, params, dry_run, verbose):
                     region_scan_types = 0
                     account_details = []
                     for account in scanning_status.get('accounts', []):
-                        account_id = account.get('accountId')
                         resource_state = account.get('resourceState', {})
-                        enabled_scan_types = []
-                        
-                        for resource_type, state_info in resource_state.items():
-                            if state_info.get('status') == 'ENABLED':
-                                region_scan_types += 1
-                                total_scan_types_enabled += 1
-                                enabled_scan_types.append(resource_type)
+                        enabled_scan_types = [
+                            resource_type for resource_type, state_info in resource_state.items()
+                            if state_info.get('status') == 'ENABLED'
+                        ]
                         
                         if enabled_scan_types:
+                            region_scan_types += len(enabled_scan_types)
                             account_details.append({
-                                'account_id': account_id,
+                                'account_id': account.get('accountId'),
                                 'enabled_scan_types': enabled_scan_types
                             })
                     
+                    total_scan_types_enabled += region_scan_types
+                    
                     if region_scan_types > 0:
                         inspector_is_active = True
                         is_configured_region = region in regions
@@ -124,8 +126,9 @@ def setup_inspector(enabled, params, dry_run, verbose):
                     if inspector_delegation_exists:
                         try:
                             members_paginator = inspector_client.get_paginator('list_members')
-                            for page in members_paginator.paginate():
-                                total_members += len(page.get('members', []))
+                            total_members += sum(
+                                1 for _ in iter_paginated(members_paginator, 'members', PaginationConfig={'PageSize': MEMBERS_PAGE_SIZE})
+                            )
                         except Exception:
                             pass
                 except Exception:
@@ -260,11 +263,12 @@ def setup_inspector(enabled, params, dry_run, verbose):
         inspector_status = {}
         any_changes_needed = False
         
-        for region in regions:
+        def check_region(region):
             if verbose:
                 printc(GRAY, f"\n Checking Inspector in region {region}...")
-            
-            region_status = check_inspector_in_region(region, admin_account, security_account, cross_account_role, verbose)
+            return check_inspector_in_region(region, admin_account, security_account, cross_account_role, verbose)
+        
+        for region, region_status in check_regions_in_parallel(check_region, regions).items():
             inspector_status[region] = region_status
             
             if not region_status['needs_changes']:
@@ -448,18 +452,23 @@ def check_inspector_in_region(region, admin_account, security_account, cross_acc
                 status['service_details'].append("❌ No delegation found - should delegate to Security account")
         # Check Inspector configuration from admin account perspective
         if is_delegated_to_security:
+            member_counts_future = None
             try:
                 inspector_client = get_client('inspector2', admin_account, region, cross_account_role)
                 
+                # The member listing doesn't depend on the scanning status, so overlap the two
+                member_counts_future = run_concurrently(count_member_statuses, inspector_client)
+                
                 # Check scanning status
                 scanning_response = inspector_client.batch_get_account_status()
                 
-                scan_types_enabled = 0
-                for account in scanning_response.get('accounts', []):
-                    resource_state = account.get('resourceState', {})
-                    for resource_type, state_info in resource_state.items():
-                        if state_info.get('status') == 'ENABLED':
-                            scan_types_enabled += 1
+                # Only the count is needed here, so don't build per-account lists
+                scan_types_enabled = sum(
+                    1
+                    for account in scanning_response.get('accounts', [])
+                    for state_info in account.get('resourceState', {}).values()
+                    if state_info.get('status') == 'ENABLED'
+                )
                 
                 status['scan_types_enabled'] = scan_types_enabled
                 status['service_enabled'] = True  # Delegation exists, consider enabled
@@ -467,26 +476,17 @@ def check_inspector_in_region(region, admin_account, security_account, cross_acc
                 
                 # Check member accounts
                 try:
-                    members_paginator = inspector_client.get_paginator('list_members')
-                    all_members = []
-                    for page in members_paginator.paginate():
-                        all_members.extend(page.get('members', []))
+                    status_counts = member_counts_future.result()
+                    status['member_count'] = sum(status_counts.values())
+                    status['service_details'].append(f"✅ Inspector Members: {status['member_count']} accounts")
                     
-                    status['member_count'] = len(all_members)
-                    status['service_details'].append(f"✅ Inspector Members: {len(all_members)} accounts")
-                    
-                    if len(all_members) == 0:
+                    if status['member_count'] == 0:
                         status['needs_changes'] = True
                         status['issues'].append("Inspector has no member accounts configured")
                         status['actions'].append("Add organization member accounts to Inspector")
                         status['actions'].append("Enable auto-enrollment for new accounts")
                     else:
                         # Show member status breakdown
-                        status_counts = {}
-                        for member in all_members:
-                            member_status = member.get('relationshipStatus', 'UNKNOWN')
-                            status_counts[member_status] = status_counts.get(member_status, 0) + 1
-                        
                         for member_status, count in status_counts.items():
                             status['service_details'].append(f"      {member_status}: {count} members")
                             
@@ -499,6 +499,12 @@ def check_inspector_in_region(region, admin_account, security_account, cross_acc
                 error_msg = f"Inspector configuration check failed: {str(e)}"
                 status['errors'].append(error_msg)
                 status['service_details'].append(f"❌ Configuration check failed: {str(e)}")
+                
+                # Don't leave the member listing running behind the failed check
+                if member_counts_future is not None:
+                    members_error = member_counts_future.exception()
+                    if members_error:
+                        status['errors'].append(f"List members failed: {str(members_error)}")
         
     except Exception as e:
         error_msg = f"General error checking region {region}: {str(e)}"
@@ -574,4 +580,13 @@ def check_inspector_auto_activation(regions, admin_account, security_account, cr
     except Exception as e:
         if verbose:
             printc(GRAY, f"    ⚠️  Auto-activation check error: {str(e)}")
-        return auto_activation_info
\ No newline at end of file
+        return auto_activation_info
+
+
+def count_member_statuses(inspector_client):
+    """Tally Inspector member accounts by relationship status as the pages arrive."""
+    members_paginator = inspector_client.get_paginator('list_members')
+    return Counter(
+        member.get('relationshipStatus', 'UNKNOWN')
+        for member in iter_paginated(members_paginator, 'members', PaginationConfig={'PageSize': MEMBERS_PAGE_SIZE})
+    )
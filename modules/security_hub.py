@@ -21,7 +21,7 @@ Automates the manual steps:
    idea to wait 24 hours to verify your control setup.
 """
 
-from .utils import printc, get_client, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
+from .utils import printc, get_client, check_regions_in_parallel, iter_paginated, MEMBERS_PAGE_SIZE, DelegationChecker, AnomalousRegionChecker, create_service_status, YELLOW, LIGHT_BLUE, GREEN, RED, GRAY, END, BOLD
 
 def setup_security_hub(enabled, params, dry_run, verbose):
     """
@@ -61,13 +61,12 @@ def setup_security_hub(enabled, params, dry_run, verbose):
             delegation_status = check_security_hub_delegation(admin_account, security_account, regions, cross_account_role, verbose)
             
             # Analyze configuration in each region
-            overall_config = {}
-            for region in regions:
+            def check_region(region):
                 if verbose:
                     printc(GRAY, f" Checking Security Hub in region: {region}")
-                
-                config = check_security_hub_in_region(region, admin_account, security_account, cross_account_role, verbose)
-                overall_config[region] = config
+                return check_security_hub_in_region(region, admin_account, security_account, cross_account_role, verbose)
+            
+            overall_config = check_regions_in_parallel(check_region, regions)
             
             # Check control policies if delegated
             control_policies = {}
@@ -272,12 +271,10 @@ def check_security_hub_in_region(region: str, admin_account: str, security_accou
             
             # Get member accounts (requires pagination)
             try:
-                members = []
                 paginator = client_to_use.get_paginator('list_members')
-                for page in paginator.paginate():
-                    members.extend(page.get('Members', []))
-                
-                hub_config['member_count'] = len(members)
+                hub_config['member_count'] = sum(
+                    1 for _ in iter_paginated(paginator, 'Members', PaginationConfig={'PageSize': MEMBERS_PAGE_SIZE})
+                )
                 
                 if verbose:
                     printc(GRAY, f"      Member accounts: {hub_config['member_count']}")
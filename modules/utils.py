@@ -3,10 +3,20 @@ Shared utilities for Foundation Security Services Setup.
 Contains common functions, constants, and data structures used across all modules.
 """
 
+import io
+import json
+import os
+import threading
+import time
 import boto3
-from botocore.exceptions import ClientError
+import botocore.session
+from botocore.config import Config
+from botocore.credentials import CredentialProvider, CredentialResolver, RefreshableCredentials
+from botocore.exceptions import ClientError, EndpointConnectionError
+from botocore.loaders import create_loader
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Callable
 
 # ANSI Color codes (matching Foundation-AWS-Core-SSO-Configuration)
 YELLOW = "\033[93m"
@@ -17,38 +27,223 @@ GRAY = "\033[90m"
 END = "\033[0m"
 BOLD = "\033[1m"
 
+# Per-thread output buffer, set while a region is checked on a worker thread
+_region_output = threading.local()
+
 def printc(color, string, **kwargs):
     """Print colored output with proper line clearing"""
+    buffer = getattr(_region_output, 'buffer', None)
+    if buffer is not None and 'file' not in kwargs:
+        kwargs['file'] = buffer
     print(f"{color}{string}\033[K{END}", **kwargs)
 
-def get_client(service: str, account_id: str, region: str, role_name: str):
+# Service model loader shared by every session, so each model file is parsed
+# only once per run
+_data_loader = None
+# Session for the caller's own credentials, created once
+_base_session: Optional[boto3.Session] = None
+# Assumed-role sessions pooled per (account, role): STS is called once per pair
+# and the credentials refresh themselves shortly before they expire
+_role_session_pool: Dict[Tuple[str, str], boto3.Session] = {}
+# Sessions are not thread-safe for creating clients; clients themselves are.
+# Each (account, role) has its own lock so that assuming one role never holds
+# up workers that need another
+_role_session_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_session_locks_lock = threading.Lock()
+_base_session_lock = threading.Lock()
+# Default for management calls: adaptive retries back off on throttling when regions
+# are checked in parallel, and a larger keep-alive pool reuses connections across pages
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+# For STS and anomaly probes of regions outside the configuration. Botocore also
+# retries connection errors, so an unreachable endpoint must fail fast here
+PROBE_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 3, 'mode': 'standard'},
+    max_pool_connections=50,
+    tcp_keepalive=True
+)
+
+class _AssumedRoleCredentialProvider(CredentialProvider):
+    """Credential provider handing a role session its refreshable credentials."""
+    METHOD = 'sts-assume-role'
+    CANONICAL_NAME = 'custom-foundation-assume-role'
+    
+    def __init__(self, credentials: RefreshableCredentials):
+        super().__init__()
+        self._credentials = credentials
+    
+    def load(self) -> RefreshableCredentials:
+        return self._credentials
+
+def _new_botocore_session() -> botocore.session.Session:
+    """Return a botocore session that shares the run's service model loader."""
+    global _data_loader
+    with _session_locks_lock:
+        if _data_loader is None:
+            _data_loader = create_loader()
+    botocore_session = botocore.session.get_session()
+    botocore_session.register_component('data_loader', _data_loader)
+    return botocore_session
+
+def _get_base_session() -> boto3.Session:
+    """Return the shared session for the caller's own credentials."""
+    global _base_session
+    with _base_session_lock:
+        if _base_session is None:
+            _base_session = boto3.Session(botocore_session=_new_botocore_session())
+    return _base_session
+
+def _get_role_session_lock(account_id: str, role_name: str) -> threading.Lock:
+    """Return the lock guarding the pooled session for the role."""
+    with _session_locks_lock:
+        return _role_session_locks.setdefault((account_id, role_name), threading.Lock())
+
+def _get_role_session(account_id: str, role_name: str, region: str) -> boto3.Session:
     """
-    Create a cross-account AWS client using role assumption.
-    This matches the pattern used in SOAR and other Foundation components.
+    Return the pooled session for the role, assuming it on first use.
+    
+    The caller must hold the role's lock from _get_role_session_lock.
+    The role is assumed through the regional STS endpoint of the first region
+    it is needed in; regional STS tokens are valid in all regions, including
+    opt-in ones.
     """
-    try:
-        sts_client = boto3.client('sts')
-        
-        # Assume role in the target account
+    key = (account_id, role_name)
+    session = _role_session_pool.get(key)
+    if session is not None:
+        return session
+    
+    base_session = _get_base_session()
+    with _base_session_lock:
+        sts_client = base_session.client('sts', region_name=region, config=PROBE_CLIENT_CONFIG)
+    
+    def assume_role():
         response = sts_client.assume_role(
             RoleArn=f"arn:aws:iam::{account_id}:role/{role_name}",
             RoleSessionName=f"foundation_security_services_{account_id}"
         )
-        
         credentials = response['Credentials']
-        
-        # Return configured client
-        return boto3.client(
-            service,
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken'],
-            region_name=region
-        )
+        return {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': credentials['Expiration'].isoformat()
+        }
+    
+    # Assume eagerly so failures surface here rather than on the first API call
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=assume_role(),
+        refresh_using=assume_role,
+        method=_AssumedRoleCredentialProvider.METHOD
+    )
+    botocore_session = _new_botocore_session()
+    botocore_session.register_component(
+        'credential_provider', CredentialResolver([_AssumedRoleCredentialProvider(credentials)])
+    )
+    session = boto3.Session(botocore_session=botocore_session)
+    _role_session_pool[key] = session
+    return session
+
+def get_client(service: str, account_id: str, region: str, role_name: str, config: Config = CLIENT_CONFIG):
+    """
+    Create a cross-account AWS client using role assumption.
+    This matches the pattern used in SOAR and other Foundation components.
+    
+    Pass config=PROBE_CLIENT_CONFIG for probes that should fail fast.
+    """
+    try:
+        with _get_role_session_lock(account_id, role_name):
+            return _get_role_session(account_id, role_name, region).client(service, region_name=region, config=config)
     except Exception as e:
         printc(RED, f"    ❌ Failed to assume role in account {account_id}: {str(e)}")
         return None
 
+# Upper bound on concurrent per-region checks
+MAX_REGION_WORKERS = 16
+
+def check_regions_in_parallel(check_region: Callable[[str], Dict[str, Any]], regions: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Run a per-region status check for every region.
+    
+    The checks are dominated by API latency, so regions are checked on a
+    thread pool. Each worker collects its printc output in its own buffer,
+    which is written out in region order so output never interleaves.
+    
+    Returns:
+        Dict mapping region to its status, in the order of regions
+    """
+    if len(regions) <= 1:
+        return {region: check_region(region) for region in regions}
+    
+    def check_region_buffered(region):
+        _region_output.buffer = io.StringIO()
+        try:
+            return check_region(region), _region_output.buffer.getvalue()
+        finally:
+            _region_output.buffer = None
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(regions), MAX_REGION_WORKERS)) as executor:
+        futures = {region: executor.submit(check_region_buffered, region) for region in regions}
+        for region, future in futures.items():
+            results[region], output = future.result()
+            if output:
+                print(output, end='')
+    return results
+
+def run_concurrently(func: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Start func on its own thread and return its Future.
+    
+    The thread writes printc output to the caller's region buffer, so
+    output from a region check stays with that region.
+    """
+    buffer = getattr(_region_output, 'buffer', None)
+    
+    def run():
+        _region_output.buffer = buffer
+        return func(*args, **kwargs)
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(run)
+    finally:
+        executor.shutdown(wait=False)
+
+# Largest page each list API accepts; fewer round trips on populated organizations
+ORGANIZATIONS_PAGE_SIZE = 20
+MEMBERS_PAGE_SIZE = 50  # GuardDuty, Security Hub and Inspector list_members
+DETECTIVE_MEMBERS_PAGE_SIZE = 200
+
+def iter_paginated(paginator, result_key: str, **kwargs) -> Iterator[Dict[str, Any]]:
+    """Yield the items under result_key from each page as the page arrives."""
+    for page in paginator.paginate(**kwargs):
+        yield from page.get(result_key, [])
+
+def iter_detective_graph_members(detective_client, graph_arn: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the member accounts of a Detective behavior graph page by page.
+    
+    Detective's ListMembers has no boto3 paginator, so NextToken is
+    followed here, asking for the largest page the API allows.
+    """
+    request = {'GraphArn': graph_arn, 'MaxResults': DETECTIVE_MEMBERS_PAGE_SIZE}
+    while True:
+        response = detective_client.list_members(**request)
+        yield from response.get('MemberDetails', [])
+        next_token = response.get('NextToken')
+        if not next_token:
+            return
+        request['NextToken'] = next_token
+
+# Delegated administrators per (service principal, admin account, role) for this run
+_delegated_admins_cache: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+# One lock per key, so that looking up one service never holds up another
+_delegated_admins_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+_delegated_admins_locks_lock = threading.Lock()
+
 class DelegationChecker:
     """Shared delegation checking logic for AWS services"""
     
@@ -64,29 +259,21 @@ class DelegationChecker:
         }
         
         try:
-            orgs_client = get_client('organizations', admin_account, 'us-east-1', cross_account_role)
-            if not orgs_client:
+            all_delegated_admins = DelegationChecker.list_delegated_admins(service_principal, admin_account, cross_account_role)
+            if all_delegated_admins is None:
                 result['delegation_check_failed'] = True
                 result['errors'].append('Failed to get organizations client')
                 return result
             
-            all_delegated_admins = []
-            paginator = orgs_client.get_paginator('list_delegated_administrators')
-            for page in paginator.paginate(ServicePrincipal=service_principal):
-                all_delegated_admins.extend(page.get('DelegatedAdministrators', []))
-            
             # Store delegation details for inspection
             result['delegation_details'] = all_delegated_admins
             
-            # Check if delegated to our security account
-            for admin in all_delegated_admins:
-                if admin.get('Id') == security_account:
-                    result['is_delegated_to_security'] = True
-                    result['delegated_admin_account'] = security_account
-                    return result
-            
-            # Check if delegated to other accounts
-            if all_delegated_admins:
+            # Check if delegated to our security account, otherwise to other accounts
+            security_admin = next((admin for admin in all_delegated_admins if admin.get('Id') == security_account), None)
+            result['is_delegated_to_security'] = security_admin is not None
+            if security_admin is not None:
+                result['delegated_admin_account'] = security_account
+            elif all_delegated_admins:
                 result['delegated_admin_account'] = all_delegated_admins[0].get('Id')
             
             return result
@@ -98,6 +285,30 @@ class DelegationChecker:
             result['errors'].append(str(e))
             return result
     
+    @staticmethod
+    def list_delegated_admins(service_principal: str, admin_account: str, cross_account_role: str = 'AWSControlTowerExecution') -> Optional[List[Dict[str, Any]]]:
+        """
+        List a service's delegated administrators, calling Organizations once per run.
+        
+        Organizations is global, so the answer is the same for every region.
+        Returns None when no Organizations client is available; API errors
+        propagate and are not cached.
+        """
+        key = (service_principal, admin_account, cross_account_role)
+        with _delegated_admins_locks_lock:
+            key_lock = _delegated_admins_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in _delegated_admins_cache:
+                orgs_client = get_client('organizations', admin_account, 'us-east-1', cross_account_role)
+                if not orgs_client:
+                    return None
+                paginator = orgs_client.get_paginator('list_delegated_administrators')
+                _delegated_admins_cache[key] = list(iter_paginated(
+                    paginator, 'DelegatedAdministrators',
+                    ServicePrincipal=service_principal, PaginationConfig={'PageSize': ORGANIZATIONS_PAGE_SIZE}
+                ))
+            return list(_delegated_admins_cache[key])
+    
     @staticmethod
     def handle_delegation_error(error, service_name=None):
         """Handle delegation errors consistently"""
@@ -115,10 +326,10 @@ def get_unexpected_aws_regions(expected_regions):
     """Get list of AWS regions not in the expected list"""
     try:
         # For testing purposes, this should be mocked
-        ec2_client = boto3.client('ec2', region_name=expected_regions[0] if expected_regions else 'us-east-1')
-        
-        regions_response = ec2_client.describe_regions()
-        all_regions = [region['RegionName'] for region in regions_response['Regions']]
+        all_regions = get_region_names(
+            'default',
+            lambda: _get_base_session().client('ec2', region_name=expected_regions[0] if expected_regions else 'us-east-1', config=CLIENT_CONFIG)
+        )
         
         # Return regions that are NOT in our expected list
         return [region for region in all_regions if region not in expected_regions]
@@ -132,7 +343,7 @@ def get_unexpected_aws_regions(expected_regions):
 # Standardized Status Data Structures
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class ServiceRegionStatus:
     """
     Standardized status structure for all AWS security services in a region.
@@ -174,7 +385,7 @@ class ServiceRegionStatus:
     
 
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class AnomalousRegionStatus:
     """
     Standardized structure for anomalous/spurious resource detection.
@@ -201,13 +412,13 @@ class AnomalousRegionStatus:
 
 
 # Service-specific extensions for unique requirements
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class GuardDutyRegionStatus(ServiceRegionStatus):
     """GuardDuty-specific fields that don't fit the common pattern."""
     organization_auto_enable: bool = False
 
 
-@dataclass  
+@dataclass(slots=True, eq=False, kw_only=True)
 class SecurityHubRegionStatus(ServiceRegionStatus):
     """Security Hub-specific fields for complex policy management."""
     hub_arn: Optional[str] = None
@@ -219,26 +430,26 @@ class SecurityHubRegionStatus(ServiceRegionStatus):
     main_region_aggregation: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class ConfigRegionStatus(ServiceRegionStatus):
     """AWS Config-specific fields (no delegation support)."""
     records_global_iam: bool = False
 
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class AccessAnalyzerRegionStatus(ServiceRegionStatus):
     """Access Analyzer-specific fields for different analyzer types."""
     external_analyzer_count: int = 0
     unused_analyzer_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class DetectiveRegionStatus(ServiceRegionStatus):
     """Detective-specific fields for investigation graphs."""
     graph_arn: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False, kw_only=True)
 class InspectorRegionStatus(ServiceRegionStatus):
     """Inspector-specific fields for vulnerability scanning."""
     scan_types_enabled: int = 0
@@ -286,6 +497,177 @@ def create_anomalous_status(region: str, resource_count: int = 0) -> AnomalousRe
     )
 
 
+# ============================================================================
+# Region List Cache
+# ============================================================================
+
+# Regions enabled per account, as returned by EC2 DescribeRegions. The list
+# only changes when AWS launches a region or an opt-in region is enabled, so a
+# day-old copy avoids the call on repeated runs.
+REGIONS_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'opensecops', 'regions.json')
+REGIONS_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def get_region_names(account_key: str, create_ec2_client: Callable[[], Any]) -> List[str]:
+    """
+    Return the region names enabled for an account, cached on disk for a day.
+    
+    Args:
+        account_key: Account the regions are listed for ('default' for the caller's own credentials)
+        create_ec2_client: Builds the EC2 client; only called when the cache is missing or stale
+    """
+    try:
+        with open(REGIONS_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    
+    entry = cache.get(account_key)
+    if isinstance(entry, dict) and time.time() - entry.get('fetched_at', 0) < REGIONS_CACHE_TTL_SECONDS:
+        return entry['regions']
+    
+    regions_response = create_ec2_client().describe_regions()
+    region_names = [region['RegionName'] for region in regions_response['Regions']]
+    
+    cache[account_key] = {'fetched_at': time.time(), 'regions': region_names}
+    try:
+        os.makedirs(os.path.dirname(REGIONS_CACHE_FILE), exist_ok=True)
+        with open(REGIONS_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        printc(GRAY, f"  (Could not save region cache: {str(e)})")
+    
+    return region_names
+
+
+def clear_regions_cache():
+    """Forget the cached region lists so they are fetched again."""
+    try:
+        os.remove(REGIONS_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+
+
+# ============================================================================
+# Unreachable Region Cache
+# ============================================================================
+
+# (account, service_name, region) entries where the service reported that the
+# operation is unsupported in the region. Persisted between runs so that the
+# anomaly scan does not pay for the same futile probes every time. Entries
+# expire like the region list, since AWS can bring a service to a region.
+UNREACHABLE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'opensecops', 'unreachable_regions.json')
+UNREACHABLE_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+_unreachable_cache: Optional[Dict[Tuple[str, str, str], float]] = None
+_unreachable_cache_dirty = False
+
+
+# Error codes meaning the service cannot be used in a region at all. Connection
+# errors are not among them: they may be transient and must not hide a region.
+_UNREACHABLE_ERROR_CODES = frozenset({'UnsupportedOperation'})
+
+
+def _is_unreachable_error(error: Exception) -> bool:
+    """Return True if the error means the service cannot be used in the region at all."""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code') in _UNREACHABLE_ERROR_CODES
+    return False
+
+
+def load_unreachable_cache() -> Dict[Tuple[str, str, str], float]:
+    """
+    Load the unreachable region cache from disk, once per process.
+    
+    Returns:
+        Dict mapping (account, service, region) to when it was found unreachable;
+        expired entries are dropped
+    """
+    global _unreachable_cache
+    
+    if _unreachable_cache is None:
+        _unreachable_cache = {}
+        try:
+            with open(UNREACHABLE_CACHE_FILE) as f:
+                entries = json.load(f)
+            now = time.time()
+            _unreachable_cache = {
+                (account, service, region): marked_at
+                for account, service, region, marked_at in entries
+                if now - marked_at < UNREACHABLE_CACHE_TTL_SECONDS
+            }
+        except (OSError, ValueError, TypeError):
+            pass  # Missing, unreadable or old-format cache simply means nothing is known yet
+    
+    return _unreachable_cache
+
+
+def is_region_unreachable(account_id: str, service_name: str, region: str) -> bool:
+    """Return True if the service was recently found unusable in the account's region."""
+    return (account_id, service_name, region) in load_unreachable_cache()
+
+
+def mark_region_unreachable(account_id: str, service_name: str, region: str):
+    """Remember that a service cannot be used in an account's region."""
+    global _unreachable_cache_dirty
+    
+    cache = load_unreachable_cache()
+    if (account_id, service_name, region) not in cache:
+        cache[(account_id, service_name, region)] = time.time()
+        _unreachable_cache_dirty = True
+
+
+def save_unreachable_cache():
+    """Write the unreachable region cache to disk if it has changed."""
+    global _unreachable_cache_dirty
+    
+    if not _unreachable_cache_dirty:
+        return
+    
+    try:
+        os.makedirs(os.path.dirname(UNREACHABLE_CACHE_FILE), exist_ok=True)
+        with open(UNREACHABLE_CACHE_FILE, 'w') as f:
+            json.dump(sorted([*key, marked_at] for key, marked_at in _unreachable_cache.items()), f)
+        _unreachable_cache_dirty = False
+    except OSError as e:
+        printc(GRAY, f"  (Could not save unreachable region cache: {str(e)})")
+
+
+def clear_unreachable_cache():
+    """Forget all cached unreachable regions so every region is probed again."""
+    global _unreachable_cache, _unreachable_cache_dirty
+    
+    _unreachable_cache = {}
+    _unreachable_cache_dirty = False
+    try:
+        os.remove(UNREACHABLE_CACHE_FILE)
+    except FileNotFoundError:
+        pass
+
+
+# Skeletons for per-member account details; copying a template is cheaper than
+# building the literal for every member account in large organizations
+_HUB_MEMBER_TEMPLATE = {
+    'account_id': None,
+    'account_status': 'MEMBER_ACCOUNT',
+    'member_status': 'Unknown',
+    'hub_status': 'ENABLED'
+}
+_GRAPH_MEMBER_TEMPLATE = {
+    'account_id': None,
+    'account_status': 'MEMBER_ACCOUNT',
+    'member_status': 'Unknown'
+}
+_DETECTOR_MEMBER_TEMPLATE = {
+    'account_id': None,
+    'account_status': 'MEMBER_ACCOUNT',
+    'member_status': 'Unknown',
+    'detector_status': 'ENABLED'  # If they're members, detector is enabled
+}
+
+
 class AnomalousRegionChecker:
     """Shared anomalous region detection logic for AWS services following DelegationChecker pattern."""
     
@@ -312,9 +694,6 @@ class AnomalousRegionChecker:
         Returns:
             List of AnomalousRegionStatus objects with standardized structure
         """
-        from botocore.exceptions import ClientError
-        import boto3
-        
         anomalous_regions = []
         
         # Get service configuration first to validate service name (this can raise ValueError)
@@ -322,63 +701,69 @@ class AnomalousRegionChecker:
         
         try:
             # Get all AWS regions to check for anomalous resources
-            ec2_client = get_client('ec2', admin_account, expected_regions[0] if expected_regions else 'us-east-1', cross_account_role)
-            regions_response = ec2_client.describe_regions()
-            all_regions = [region['RegionName'] for region in regions_response['Regions']]
-            
-            # Check regions that are NOT in our expected list
-            unexpected_regions = [region for region in all_regions if region not in expected_regions]
-            
+            all_regions = get_region_names(
+                admin_account,
+                lambda: get_client('ec2', admin_account, expected_regions[0] if expected_regions else 'us-east-1', cross_account_role)
+            )
+        except Exception as e:
             if verbose:
-                printc(GRAY, f"    Checking {len(unexpected_regions)} regions outside configuration...")
+                printc(GRAY, f"    ⚠️  Anomaly check failed: {str(e)}")
+            return anomalous_regions
+        
+        # Check regions that are NOT in our expected list
+        unexpected_regions = [region for region in all_regions if region not in expected_regions]
+        
+        if verbose:
+            printc(GRAY, f"    Checking {len(unexpected_regions)} regions outside configuration...")
+        
+        for region in unexpected_regions:
+            if is_region_unreachable(admin_account, service_name, region):
+                continue
             
-            for region in unexpected_regions:
-                try:
-                    # Get appropriate client (cross-account vs direct)
-                    if service_config['supports_cross_account'] and security_account:
-                        service_client = get_client(service_config['aws_service'], security_account, region, cross_account_role)
-                        if not service_client:
-                            service_client = get_client(service_config['aws_service'], admin_account, region, cross_account_role)
-                    else:
-                        service_client = get_client(service_config['aws_service'], admin_account, region, cross_account_role)
-                    
+            try:
+                # Get appropriate client (cross-account vs direct)
+                if service_config['supports_cross_account'] and security_account:
+                    service_client = get_client(service_config['aws_service'], security_account, region, cross_account_role, config=PROBE_CLIENT_CONFIG)
                     if not service_client:
-                        continue
-                    
-                    # Check for active resources using service-specific logic
-                    resources, account_details = AnomalousRegionChecker._check_service_resources(
-                        service_client, service_config, admin_account, region, verbose
-                    )
-                    
-                    if resources:
-                        # Create standardized anomalous status
-                        anomalous_status = create_anomalous_status(region, len(resources))
-                        anomalous_status.resource_details = resources
-                        anomalous_status.account_details = account_details
-                        anomalous_regions.append(anomalous_status)
-                        
-                        if verbose:
-                            printc(YELLOW, f"    ⚠️  Anomalous {service_name} in {region}: {len(resources)} resources")
-                            
-                except ClientError as e:
-                    # Don't show common "service not available" errors
-                    if 'Could not connect to the endpoint URL' not in str(e) and 'UnsupportedOperation' not in str(e):
-                        if verbose:
-                            printc(GRAY, f"    (Skipping {region}: {str(e)})")
-                    continue
-                except Exception as e:
-                    # Don't show common connectivity errors
-                    if 'Could not connect to the endpoint URL' not in str(e):
-                        if verbose:
-                            printc(GRAY, f"    (Error checking {region}: {str(e)})")
+                        service_client = get_client(service_config['aws_service'], admin_account, region, cross_account_role, config=PROBE_CLIENT_CONFIG)
+                else:
+                    service_client = get_client(service_config['aws_service'], admin_account, region, cross_account_role, config=PROBE_CLIENT_CONFIG)
+                
+                if not service_client:
                     continue
+                
+                # Check for active resources using service-specific logic
+                resources, account_details = AnomalousRegionChecker._check_service_resources(
+                    service_client, service_config, admin_account, region, verbose
+                )
+                
+            except EndpointConnectionError:
+                # Service endpoint could not be reached in this region - skip it silently
+                continue
+            except ClientError as e:
+                # Don't show common "service not available" errors, just remember them
+                if _is_unreachable_error(e):
+                    mark_region_unreachable(admin_account, service_name, region)
+                elif verbose:
+                    printc(GRAY, f"    (Skipping {region}: {str(e)})")
+                continue
+            except Exception as e:
+                if verbose:
+                    printc(GRAY, f"    (Error checking {region}: {str(e)})")
+                continue
             
-            return anomalous_regions
-            
-        except Exception as e:
-            if verbose:
-                printc(GRAY, f"    ⚠️  Anomaly check failed: {str(e)}")
-            return []
+            if resources:
+                # Create standardized anomalous status
+                anomalous_status = create_anomalous_status(region, len(resources))
+                anomalous_status.resource_details = resources
+                anomalous_status.account_details = account_details
+                
+                if verbose:
+                    printc(YELLOW, f"    ⚠️  Anomalous {service_name} in {region}: {len(resources)} resources")
+                
+                anomalous_regions.append(anomalous_status)
+        
+        return anomalous_regions
     
     @staticmethod
     def _get_service_config(service_name: str) -> Dict[str, Any]:
@@ -386,6 +771,7 @@ class AnomalousRegionChecker:
         configs = {
             'guardduty': {
                 'aws_service': 'guardduty',
+                'strategy': 'standard',
                 'list_method': 'list_detectors',
                 'resource_field': 'DetectorIds',
                 'supports_cross_account': True,
@@ -395,14 +781,15 @@ class AnomalousRegionChecker:
             },
             'security_hub': {
                 'aws_service': 'securityhub',
+                'strategy': 'exception_when_none',  # Single hub per region, throws when none
                 'list_method': 'describe_hub',
-                'resource_field': None,  # Single hub per region
+                'resource_field': None,
                 'supports_cross_account': True,
-                'exception_when_none': True,
                 'member_method': 'list_members'
             },
             'detective': {
                 'aws_service': 'detective',
+                'strategy': 'standard',
                 'list_method': 'list_graphs',
                 'resource_field': 'GraphList',
                 'supports_cross_account': True,
@@ -410,23 +797,24 @@ class AnomalousRegionChecker:
             },
             'inspector': {
                 'aws_service': 'inspector2',
+                'strategy': 'embedded_accounts',
                 'list_method': 'batch_get_account_status',
                 'resource_field': 'accounts',
-                'supports_cross_account': False,
-                'embedded_accounts': True
+                'supports_cross_account': False
             },
             'aws_config': {
                 'aws_service': 'config',
+                'strategy': 'standard',
                 'list_method': 'describe_configuration_recorders',
                 'resource_field': 'ConfigurationRecorders',
                 'supports_cross_account': False
             },
             'access_analyzer': {
                 'aws_service': 'accessanalyzer',
+                'strategy': 'paginator',
                 'list_method': 'list_analyzers',
-                'resource_field': None,  # Uses paginator
-                'supports_cross_account': True,
-                'uses_paginator': True
+                'resource_field': None,
+                'supports_cross_account': True
             }
         }
         
@@ -437,161 +825,180 @@ class AnomalousRegionChecker:
     
     @staticmethod
     def _check_service_resources(service_client, config: Dict[str, Any], admin_account: str, region: str, verbose: bool):
-        """Check for active resources using service-specific logic."""
-        from botocore.exceptions import ClientError
+        """Check for active resources using the service's API strategy."""
+        check_resources = AnomalousRegionChecker._RESOURCE_STRATEGIES[config['strategy']]
         
+        try:
+            return check_resources(service_client, config, admin_account)
+        except Exception as e:
+            # Let the caller skip or record regions where the service is unreachable
+            if isinstance(e, EndpointConnectionError) or _is_unreachable_error(e):
+                raise
+            if verbose:
+                printc(GRAY, f"    (Error checking resources in {region}: {str(e)})")
+            return [], []
+    
+    @staticmethod
+    def _check_hub_resources(service_client, config: Dict[str, Any], admin_account: str):
+        """Security Hub pattern - describe call throws an exception when there is no hub."""
         resources = []
         account_details = []
         
         try:
-            # Handle different API patterns
-            if config.get('exception_when_none'):
-                # Security Hub pattern - throws exception when no hub
+            response = getattr(service_client, config['list_method'])()
+        except ClientError:
+            # No hub found (expected for most regions)
+            return resources, account_details
+        
+        if response:
+            resources.append({
+                'hub_arn': response.get('HubArn'),
+                'subscribed_at': str(response.get('SubscribedAt', '')),
+                'auto_enable_controls': response.get('AutoEnableControls', False)
+            })
+            account_details.append({
+                'account_id': admin_account,
+                'account_status': 'ADMIN_ACCOUNT',
+                'hub_status': 'ENABLED'
+            })
+            
+            # Get Security Hub member details
+            if config.get('member_method'):
                 try:
-                    response = getattr(service_client, config['list_method'])()
-                    if response:
-                        resources.append({
-                            'hub_arn': response.get('HubArn'),
-                            'subscribed_at': str(response.get('SubscribedAt', '')),
-                            'auto_enable_controls': response.get('AutoEnableControls', False)
-                        })
-                        account_details.append({
-                            'account_id': admin_account,
-                            'account_status': 'ADMIN_ACCOUNT',
-                            'hub_status': 'ENABLED'
-                        })
-                        
-                        # Get Security Hub member details
-                        if config.get('member_method'):
-                            try:
-                                members_response = getattr(service_client, config['member_method'])()
-                                for member in members_response.get('Members', []):
-                                    account_details.append({
-                                        'account_id': member.get('AccountId'),
-                                        'account_status': 'MEMBER_ACCOUNT',
-                                        'member_status': member.get('MemberStatus', 'Unknown'),
-                                        'hub_status': 'ENABLED'
-                                    })
-                            except Exception:
-                                pass  # Member details are optional
-                                
-                except ClientError:
-                    # No hub found (expected for most regions)
-                    pass
-                    
-            elif config.get('uses_paginator'):
-                # Access Analyzer pattern - uses paginator
-                paginator = service_client.get_paginator(config['list_method'])
-                for page in paginator.paginate():
-                    analyzers = page.get('analyzers', [])
-                    for analyzer in analyzers:
-                        resources.append({
-                            'analyzer_name': analyzer.get('name'),
-                            'analyzer_type': analyzer.get('type'),
-                            'status': analyzer.get('status')
-                        })
-                    
-                if resources:
-                    account_details.append({
-                        'account_id': admin_account,
-                        'account_status': 'ADMIN_ACCOUNT',
-                        'analyzer_status': 'ENABLED'
-                    })
-                    
-            elif config.get('embedded_accounts'):
-                # Inspector pattern - account details embedded in response
-                response = getattr(service_client, config['list_method'])()
-                accounts = response.get(config['resource_field'], [])
-                
-                for account in accounts:
-                    resource_state = account.get('resourceState', {})
-                    enabled_resources = []
-                    for resource_type, state_info in resource_state.items():
-                        if state_info.get('status') == 'ENABLED':
-                            enabled_resources.append(resource_type)
-                    
-                    if enabled_resources:
-                        resources.extend(enabled_resources)
-                        account_details.append({
-                            'account_id': account.get('accountId'),
-                            'scanning_status': 'ENABLED',
-                            'enabled_scan_types': enabled_resources
-                        })
-                        
+                    members_response = getattr(service_client, config['member_method'])()
+                    for member in members_response.get('Members', []):
+                        detail = _HUB_MEMBER_TEMPLATE.copy()
+                        detail['account_id'] = member.get('AccountId')
+                        detail['member_status'] = member.get('MemberStatus', 'Unknown')
+                        account_details.append(detail)
+                except Exception:
+                    pass  # Member details are optional
+        
+        return resources, account_details
+    
+    @staticmethod
+    def _check_paginated_resources(service_client, config: Dict[str, Any], admin_account: str):
+        """Access Analyzer pattern - resources are listed through a paginator."""
+        resources = []
+        account_details = []
+        
+        paginator = service_client.get_paginator(config['list_method'])
+        for analyzer in iter_paginated(paginator, 'analyzers'):
+            resources.append({
+                'analyzer_name': analyzer.get('name'),
+                'analyzer_type': analyzer.get('type'),
+                'status': analyzer.get('status')
+            })
+        
+        if resources:
+            account_details.append({
+                'account_id': admin_account,
+                'account_status': 'ADMIN_ACCOUNT',
+                'analyzer_status': 'ENABLED'
+            })
+        
+        return resources, account_details
+    
+    @staticmethod
+    def _check_embedded_account_resources(service_client, config: Dict[str, Any], admin_account: str):
+        """Inspector pattern - account details are embedded in the response."""
+        resources = []
+        account_details = []
+        
+        response = getattr(service_client, config['list_method'])()
+        accounts = response.get(config['resource_field'], [])
+        
+        for account in accounts:
+            resource_state = account.get('resourceState', {})
+            enabled_resources = [
+                resource_type for resource_type, state_info in resource_state.items()
+                if state_info.get('status') == 'ENABLED'
+            ]
+            
+            if enabled_resources:
+                resources.extend(enabled_resources)
+                account_details.append({
+                    'account_id': account.get('accountId'),
+                    'scanning_status': 'ENABLED',
+                    'enabled_scan_types': enabled_resources
+                })
+        
+        return resources, account_details
+    
+    @staticmethod
+    def _check_standard_resources(service_client, config: Dict[str, Any], admin_account: str):
+        """Standard pattern (GuardDuty, Detective, Config) - list call returns the resources."""
+        resources = []
+        account_details = []
+        
+        response = getattr(service_client, config['list_method'])()
+        
+        if config['resource_field']:
+            resource_list = response.get(config['resource_field'], [])
+        else:
+            resource_list = [response] if response else []
+        
+        for resource in resource_list:
+            if config.get('detail_method'):
+                # Get detailed info (GuardDuty pattern)
+                detail_response = getattr(service_client, config['detail_method'])(
+                    **{config['detail_param']: resource}
+                )
+                resources.append({
+                    'resource_id': resource,
+                    'status': detail_response.get('Status', 'Unknown'),
+                    'details': detail_response
+                })
             else:
-                # Standard pattern (GuardDuty, Detective, Config)
-                response = getattr(service_client, config['list_method'])()
-                
-                if config['resource_field']:
-                    resource_list = response.get(config['resource_field'], [])
-                else:
-                    resource_list = [response] if response else []
-                
-                for resource in resource_list:
-                    if config.get('detail_method'):
-                        # Get detailed info (GuardDuty pattern)
-                        detail_response = getattr(service_client, config['detail_method'])(
-                            **{config['detail_param']: resource}
-                        )
-                        resources.append({
-                            'resource_id': resource,
-                            'status': detail_response.get('Status', 'Unknown'),
-                            'details': detail_response
-                        })
-                    else:
-                        # Use resource directly (Detective, Config pattern)
-                        resources.append(resource)
-                
-                # Add admin account details for non-embedded account patterns
-                if resources and not config.get('embedded_accounts'):
-                    admin_detail = {
-                        'account_id': admin_account,
-                        'account_status': 'ADMIN_ACCOUNT',
-                        'service_status': 'ENABLED'
-                    }
-                    
-                    # Add service-specific status information
-                    if config['aws_service'] == 'guardduty':
-                        admin_detail['detector_status'] = 'ENABLED'
-                    elif config['aws_service'] == 'securityhub':
-                        admin_detail['hub_status'] = 'ENABLED'
-                    elif config['aws_service'] == 'detective':
-                        admin_detail['graph_status'] = 'ENABLED'
-                    
-                    account_details.append(admin_detail)
-                    
-                    # Get member details for services that support it
-                    if config.get('member_method'):
-                        try:
-                            if config['aws_service'] == 'detective':
-                                # Detective uses GraphArn parameter
-                                for resource in resources:
-                                    if isinstance(resource, dict) and 'Arn' in resource:
-                                        members_paginator = service_client.get_paginator(config['member_method'])
-                                        for page in members_paginator.paginate(GraphArn=resource['Arn']):
-                                            for member in page.get('MemberDetails', []):
-                                                account_details.append({
-                                                    'account_id': member.get('AccountId'),
-                                                    'account_status': 'MEMBER_ACCOUNT',
-                                                    'member_status': member.get('Status', 'Unknown')
-                                                })
-                            elif config['aws_service'] == 'guardduty':
-                                # GuardDuty uses simpler list_members call
-                                members_response = getattr(service_client, config['member_method'])()
-                                for member in members_response.get('Members', []):
-                                    account_details.append({
-                                        'account_id': member.get('AccountId'),
-                                        'account_status': 'MEMBER_ACCOUNT',
-                                        'member_status': member.get('RelationshipStatus', 'Unknown'),
-                                        'detector_status': 'ENABLED'  # If they're members, detector is enabled
-                                    })
-                        except Exception:
-                            pass  # Member details are optional
-                            
-        except Exception as e:
-            if verbose:
-                printc(GRAY, f"    (Error checking resources in {region}: {str(e)})")
+                # Use resource directly (Detective, Config pattern)
+                resources.append(resource)
+        
+        if not resources:
+            return resources, account_details
+        
+        admin_detail = {
+            'account_id': admin_account,
+            'account_status': 'ADMIN_ACCOUNT',
+            'service_status': 'ENABLED'
+        }
+        
+        # Add service-specific status information
+        if config['aws_service'] == 'guardduty':
+            admin_detail['detector_status'] = 'ENABLED'
+        elif config['aws_service'] == 'detective':
+            admin_detail['graph_status'] = 'ENABLED'
+        
+        account_details.append(admin_detail)
+        
+        # Get member details for services that support it
+        if config.get('member_method'):
+            try:
+                if config['aws_service'] == 'detective':
+                    # Detective uses GraphArn parameter
+                    for resource in resources:
+                        if isinstance(resource, dict) and 'Arn' in resource:
+                            for member in iter_detective_graph_members(service_client, resource['Arn']):
+                                detail = _GRAPH_MEMBER_TEMPLATE.copy()
+                                detail['account_id'] = member.get('AccountId')
+                                detail['member_status'] = member.get('Status', 'Unknown')
+                                account_details.append(detail)
+                elif config['aws_service'] == 'guardduty':
+                    # GuardDuty uses simpler list_members call
+                    members_response = getattr(service_client, config['member_method'])()
+                    for member in members_response.get('Members', []):
+                        detail = _DETECTOR_MEMBER_TEMPLATE.copy()
+                        detail['account_id'] = member.get('AccountId')
+                        detail['member_status'] = member.get('RelationshipStatus', 'Unknown')
+                        account_details.append(detail)
+            except Exception:
+                pass  # Member details are optional
         
         return resources, account_details
-
-
+    
+    # Resource checking strategy per API pattern, selected by the 'strategy' config key
+    _RESOURCE_STRATEGIES = {
+        'exception_when_none': _check_hub_resources,
+        'paginator': _check_paginated_resources,
+        'embedded_accounts': _check_embedded_account_resources,
+        'standard': _check_standard_resources
+    }
@@ -6,9 +6,14 @@ functionality following the proven patterns from SOAR testing infrastructure.
 """
 
 import os
+import sys
 import pytest
 import boto3
-from moto import mock_aws
+
+# Add the project root to the path to import the shared test helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests.helpers.test_helpers import freeze
 
 # Load environment variables from .env.test if available
 try:
@@ -25,6 +30,14 @@ TEST_ORG_ID = os.getenv('TEST_ORG_ID', 'o-example12345')
 TEST_ROOT_OU = os.getenv('TEST_ROOT_OU', 'r-example12345')
 TEST_CROSS_ACCOUNT_ROLE = os.getenv('TEST_CROSS_ACCOUNT_ROLE', 'AWSControlTowerExecution')
 TEST_REGIONS = os.getenv('TEST_REGIONS', 'us-east-1,us-west-2,eu-west-1').split(',')
+TEST_SERVICE_FLAGS = {
+    'aws_config': os.getenv('TEST_AWS_CONFIG_ENABLED', 'Yes'),
+    'guardduty': os.getenv('TEST_GUARDDUTY_ENABLED', 'Yes'),
+    'security_hub': os.getenv('TEST_SECURITY_HUB_ENABLED', 'Yes'),
+    'access_analyzer': os.getenv('TEST_ACCESS_ANALYZER_ENABLED', 'Yes'),
+    'detective': os.getenv('TEST_DETECTIVE_ENABLED', 'No'),
+    'inspector': os.getenv('TEST_INSPECTOR_ENABLED', 'No')
+}
 
 @pytest.fixture
 def aws_credentials():
@@ -41,7 +54,7 @@ def test_parameters():
     return {
         'admin_account': TEST_ADMIN_ACCOUNT,
         'security_account': TEST_SECURITY_ACCOUNT,
-        'regions': TEST_REGIONS,
+        'regions': list(TEST_REGIONS),
         'cross_account_role': TEST_CROSS_ACCOUNT_ROLE,
         'org_id': TEST_ORG_ID,
         'root_ou': TEST_ROOT_OU
@@ -50,116 +63,128 @@ def test_parameters():
 @pytest.fixture
 def test_service_flags():
     """Standard service enable/disable flags for testing."""
-    return {
-        'aws_config': os.getenv('TEST_AWS_CONFIG_ENABLED', 'Yes'),
-        'guardduty': os.getenv('TEST_GUARDDUTY_ENABLED', 'Yes'),
-        'security_hub': os.getenv('TEST_SECURITY_HUB_ENABLED', 'Yes'),
-        'access_analyzer': os.getenv('TEST_ACCESS_ANALYZER_ENABLED', 'Yes'),
-        'detective': os.getenv('TEST_DETECTIVE_ENABLED', 'No'),
-        'inspector': os.getenv('TEST_INSPECTOR_ENABLED', 'No')
-    }
+    return dict(TEST_SERVICE_FLAGS)
 
-@pytest.fixture(autouse=True)
-def mock_aws_services():
-    """Mock all AWS services using moto. Auto-applied to ALL tests."""
-    with mock_aws():
-        # Mock get_client to return moto clients instead of doing real cross-account calls
-        from unittest.mock import patch
-        import boto3
-        
-        # Data-driven service configuration - clean and maintainable
-        SERVICE_MOCK_CONFIGS = {
-            'organizations': {
-                'list_delegated_administrators': {'DelegatedAdministrators': []},
-                'get_paginator': [{'DelegatedAdministrators': []}]
-            },
-            'guardduty': {
-                'list_detectors': {'DetectorIds': []},
-                'get_detector': {'Status': 'ENABLED', 'FindingPublishingFrequency': 'FIFTEEN_MINUTES'},
-                'list_members': {'Members': []},
-                'get_paginator': []
-            },
-            'detective': {
-                'list_graphs': {'GraphList': []},
-                'get_paginator': []
-            },
-            'securityhub': {
-                'describe_hub': Exception('Hub not enabled'),
-                'list_members': {'Members': []},
-                'get_enabled_standards': {'StandardsSubscriptions': []},
-                'list_finding_aggregators': {'FindingAggregators': []},
-                'get_paginator': []
-            },
-            'inspector2': {
-                'list_account_permissions': {'permissions': []},
-                'batch_get_account_status': {'accounts': []},
-                'get_paginator': []
-            },
-            'accessanalyzer': {
-                'get_paginator': []
-            },
-            'config': {
-                'describe_configuration_recorders': {'ConfigurationRecorders': []},
-                'describe_delivery_channels': {'DeliveryChannels': []},
-                'get_paginator': [{'ConfigRules': []}]
-            },
-            'ec2': {
-                'describe_regions': {
-                    'Regions': [
-                        {'RegionName': 'us-east-1'},
-                        {'RegionName': 'us-west-2'},
-                        {'RegionName': 'eu-west-1'}
-                    ]
-                }
-            }
+# Data-driven service configuration - clean and maintainable. Frozen, so no test
+# can change a shared response for the next
+SERVICE_MOCK_CONFIGS = freeze({
+    'organizations': {
+        'list_delegated_administrators': {'DelegatedAdministrators': []},
+        'get_paginator': [{'DelegatedAdministrators': []}]
+    },
+    'guardduty': {
+        'list_detectors': {'DetectorIds': []},
+        'get_detector': {'Status': 'ENABLED', 'FindingPublishingFrequency': 'FIFTEEN_MINUTES'},
+        'list_members': {'Members': []},
+        'get_paginator': []
+    },
+    'detective': {
+        'list_graphs': {'GraphList': []},
+        'list_members': {'MemberDetails': []},
+        'get_paginator': []
+    },
+    'securityhub': {
+        'describe_hub': Exception('Hub not enabled'),
+        'list_members': {'Members': []},
+        'get_enabled_standards': {'StandardsSubscriptions': []},
+        'list_finding_aggregators': {'FindingAggregators': []},
+        'get_paginator': []
+    },
+    'inspector2': {
+        'list_account_permissions': {'permissions': []},
+        'batch_get_account_status': {'accounts': []},
+        'get_paginator': []
+    },
+    'accessanalyzer': {
+        'get_paginator': []
+    },
+    'config': {
+        'describe_configuration_recorders': {'ConfigurationRecorders': []},
+        'describe_delivery_channels': {'DeliveryChannels': []},
+        'get_paginator': [{'ConfigRules': []}]
+    },
+    'ec2': {
+        'describe_regions': {
+            'Regions': [
+                {'RegionName': 'us-east-1'},
+                {'RegionName': 'us-west-2'},
+                {'RegionName': 'eu-west-1'}
+            ]
         }
-        
-        def mock_get_client(service, account_id, region, role_name):
-            """Return a pure mock client configured from data."""
-            from unittest.mock import MagicMock
-            
-            client = MagicMock()
-            config = SERVICE_MOCK_CONFIGS.get(service, {})
-            
-            for method_name, response in config.items():
-                if method_name == 'get_paginator':
-                    # Special handling for paginator
-                    paginator = MagicMock()
-                    paginator.paginate = MagicMock(return_value=response)
-                    client.get_paginator = MagicMock(return_value=paginator)
-                elif isinstance(response, Exception):
-                    # Handle methods that should raise exceptions
-                    setattr(client, method_name, MagicMock(side_effect=response))
-                else:
-                    # Normal method with return value
-                    setattr(client, method_name, MagicMock(return_value=response))
-            
-            # Make the client more flexible for tests that want to override specific methods
-            client._service_name = service
-            client._account_id = account_id
-            client._region = region
-            
-            return client
-        
-        # Patch all the get_client functions across modules
-        patches = [
-            patch('modules.utils.get_client', side_effect=mock_get_client),
-            patch('modules.aws_config.get_client', side_effect=mock_get_client),
-            patch('modules.guardduty.get_client', side_effect=mock_get_client),
-            patch('modules.security_hub.get_client', side_effect=mock_get_client),
-            patch('modules.detective.get_client', side_effect=mock_get_client),
-            patch('modules.inspector.get_client', side_effect=mock_get_client),
-            patch('modules.access_analyzer.get_client', side_effect=mock_get_client),
-        ]
-        
+    }
+})
+
+def mock_get_client(service, account_id, region, role_name, config=None):
+    """Return a pure mock client configured from data."""
+    from unittest.mock import MagicMock
+    
+    client = MagicMock()
+    service_config = SERVICE_MOCK_CONFIGS.get(service, {})
+    
+    for method_name, response in service_config.items():
+        if method_name == 'get_paginator':
+            # Special handling for paginator
+            paginator = MagicMock()
+            paginator.paginate = MagicMock(return_value=response)
+            client.get_paginator = MagicMock(return_value=paginator)
+        elif isinstance(response, Exception):
+            # Handle methods that should raise exceptions
+            setattr(client, method_name, MagicMock(side_effect=response))
+        else:
+            # Normal method with return value
+            setattr(client, method_name, MagicMock(return_value=response))
+    
+    # Make the client more flexible for tests that want to override specific methods
+    client._service_name = service
+    client._account_id = account_id
+    client._region = region
+    client._config = config
+    
+    return client
+
+@pytest.fixture(scope="session")
+def moto_mock():
+    """Mock all AWS services using moto. Started once for the whole session."""
+    # Imported here so collecting tests doesn't pay for loading moto
+    from moto import mock_aws
+    
+    with mock_aws() as aws_mock:
+        yield aws_mock
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_aws_services(moto_mock):
+    """Patch get_client in every module with data-driven mock clients, for ALL tests."""
+    # Mock get_client to return mock clients instead of doing real cross-account calls
+    from unittest.mock import patch
+    
+    # Patch all the get_client functions across modules
+    patches = [
+        patch('modules.utils.get_client', side_effect=mock_get_client),
+        patch('modules.aws_config.get_client', side_effect=mock_get_client),
+        patch('modules.guardduty.get_client', side_effect=mock_get_client),
+        patch('modules.security_hub.get_client', side_effect=mock_get_client),
+        patch('modules.detective.get_client', side_effect=mock_get_client),
+        patch('modules.inspector.get_client', side_effect=mock_get_client),
+        patch('modules.access_analyzer.get_client', side_effect=mock_get_client),
+    ]
+    
+    mocks = [p.start() for p in patches]
+    
+    try:
+        yield mocks
+    finally:
         for p in patches:
-            p.start()
-        
-        try:
-            yield
-        finally:
-            for p in patches:
-                p.stop()
+            p.stop()
+
+@pytest.fixture(autouse=True)
+def reset_aws_service_mocks(moto_mock, mock_aws_services):
+    """Start each test with empty moto backends and pristine get_client mocks."""
+    moto_mock.reset()
+    for mock in mock_aws_services:
+        # The patches live for the whole session, so also drop any return_value or
+        # side_effect a previous test set, then restore the data-driven clients
+        mock.reset_mock(return_value=True, side_effect=True)
+        mock.side_effect = mock_get_client
 
 @pytest.fixture
 def sts_client(aws_credentials, mock_aws_services):
@@ -196,15 +221,37 @@ def config_client(aws_credentials, mock_aws_services):
     """Mocked Config client for testing."""
     return boto3.client('config', region_name='us-east-1')
 
+@pytest.fixture(autouse=True)
+def isolate_region_caches(tmp_path, monkeypatch):
+    """Keep the persistent region caches out of the user's home directory."""
+    import modules.utils
+    monkeypatch.setattr(modules.utils, 'UNREACHABLE_CACHE_FILE', str(tmp_path / 'unreachable_regions.json'))
+    monkeypatch.setattr(modules.utils, 'REGIONS_CACHE_FILE', str(tmp_path / 'regions.json'))
+    monkeypatch.setattr(modules.utils, '_unreachable_cache', None)
+    monkeypatch.setattr(modules.utils, '_unreachable_cache_dirty', False)
+
+@pytest.fixture(autouse=True)
+def isolate_role_session_pool(monkeypatch):
+    """Start every test without pooled sessions or cached Organizations lookups."""
+    import modules.utils
+    monkeypatch.setattr(modules.utils, '_role_session_pool', {})
+    monkeypatch.setattr(modules.utils, '_role_session_locks', {})
+    monkeypatch.setattr(modules.utils, '_base_session', None)
+    monkeypatch.setattr(modules.utils, '_delegated_admins_cache', {})
+    monkeypatch.setattr(modules.utils, '_delegated_admins_locks', {})
+
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Automatically set up test environment for all tests."""
     # Ensure clean environment for each test
-    original_env = os.environ.copy()
+    original_env = dict(os.environ)
     yield
-    # Restore original environment after test
-    os.environ.clear()
-    os.environ.update(original_env)
+    # Restore only what the test changed; clearing os.environ rewrites every variable
+    for key in os.environ.keys() - original_env.keys():
+        del os.environ[key]
+    for key, value in original_env.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
 
 # Test markers for different test categories
 def pytest_configure(config):
@@ -70,52 +70,52 @@ def create_service_flags(
         'inspector': inspector
     }
 
-# Common test scenarios
-VALID_ACCOUNT_IDS = [
+# Common test scenarios (tuples so no test can mutate them for the next)
+VALID_ACCOUNT_IDS = (
     '123456789012', 
     '234567890123', 
     '345678901234',
     '456789012345'
-]
+)
 
-VALID_REGIONS = [
+VALID_REGIONS = (
     ['us-east-1'],
     ['us-east-1', 'us-west-2'],
     ['us-east-1', 'us-west-2', 'eu-west-1'],
     ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-southeast-1']
-]
+)
 
-VALID_ORG_IDS = [
+VALID_ORG_IDS = (
     'o-example12345',
     'o-test987654321',
     'o-prod1234567890'
-]
+)
 
-VALID_ROOT_OUS = [
+VALID_ROOT_OUS = (
     'r-example12345',
     'r-test987654321', 
     'r-prod1234567890'
-]
+)
 
 # Invalid test data for negative testing
-INVALID_ACCOUNT_IDS = [
+INVALID_ACCOUNT_IDS = (
     '12345',        # Too short
     '1234567890123',  # Too long
     'abc123456789',   # Non-numeric
     '',             # Empty
     None            # None value
-]
+)
 
-INVALID_REGIONS = [
+INVALID_REGIONS = (
     [],             # Empty list
     ['invalid-region'],  # Invalid region name
     ['us-east-1', ''],   # Empty region in list
     None            # None value
-]
+)
 
-INVALID_ORG_IDS = [
+INVALID_ORG_IDS = (
     'invalid-org',  # Wrong format
     'o-',           # Too short
     '',             # Empty
     None            # None value
-]
\ No newline at end of file
+)
\ No newline at end of file
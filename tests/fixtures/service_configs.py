@@ -5,6 +5,10 @@ This module provides test data for AWS security service configurations,
 including existing setups that should be preserved during testing.
 """
 
+from types import MappingProxyType
+
+from tests.helpers.test_helpers import freeze
+
 # GuardDuty test configurations
 GUARDDUTY_DETECTOR_CONFIG = {
     'DetectorId': 'test-detector-12345',
@@ -149,24 +153,53 @@ EXISTING_CONFIGURATIONS = {
     }
 }
 
-def create_existing_service_config(service_name, scenario='default'):
+def create_existing_service_config(service_name, scenario='default', *, mutable=False):
     """
     Create existing service configuration for testing preservation logic.
     
     Args:
         service_name (str): Name of the AWS service
         scenario (str): Configuration scenario to simulate
+        mutable (bool): Return a private dict the test may change
         
     Returns:
-        dict: Service configuration data
+        Mapping: Read-only service configuration data, or a dict copy if mutable
     """
-    configs = {
-        'guardduty': GUARDDUTY_DETECTOR_CONFIG,
-        'security_hub': SECURITY_HUB_ENABLED_CONFIG,
-        'detective': DETECTIVE_GRAPH_CONFIG,
-        'inspector': INSPECTOR_ENABLED_CONFIG,
-        'access_analyzer': ACCESS_ANALYZER_CONFIG,
-        'config': CONFIG_RECORDER_CONFIG
-    }
-    
-    return configs.get(service_name, {})
\ No newline at end of file
+    config = _SERVICE_CONFIGS.get(service_name, _EMPTY_CONFIG)
+    return _thaw(config) if mutable else config
+
+
+def _thaw(value):
+    """Build a fresh mutable copy of frozen test data."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Shared by every test, so make accidental mutation fail instead of leaking
+GUARDDUTY_DETECTOR_CONFIG = freeze(GUARDDUTY_DETECTOR_CONFIG)
+GUARDDUTY_MEMBER_CONFIG = freeze(GUARDDUTY_MEMBER_CONFIG)
+SECURITY_HUB_ENABLED_CONFIG = freeze(SECURITY_HUB_ENABLED_CONFIG)
+SECURITY_HUB_STANDARDS = freeze(SECURITY_HUB_STANDARDS)
+SECURITY_HUB_EXISTING_POLICIES = freeze(SECURITY_HUB_EXISTING_POLICIES)
+DETECTIVE_GRAPH_CONFIG = freeze(DETECTIVE_GRAPH_CONFIG)
+DETECTIVE_MEMBER_CONFIG = freeze(DETECTIVE_MEMBER_CONFIG)
+INSPECTOR_ENABLED_CONFIG = freeze(INSPECTOR_ENABLED_CONFIG)
+ACCESS_ANALYZER_CONFIG = freeze(ACCESS_ANALYZER_CONFIG)
+ACCESS_ANALYZER_UNUSED_CONFIG = freeze(ACCESS_ANALYZER_UNUSED_CONFIG)
+CONFIG_RECORDER_CONFIG = freeze(CONFIG_RECORDER_CONFIG)
+CONFIG_DELIVERY_CHANNEL_CONFIG = freeze(CONFIG_DELIVERY_CHANNEL_CONFIG)
+EXISTING_CONFIGURATIONS = freeze(EXISTING_CONFIGURATIONS)
+
+# Existing configuration per service, built once for create_existing_service_config
+_SERVICE_CONFIGS = {
+    'guardduty': GUARDDUTY_DETECTOR_CONFIG,
+    'security_hub': SECURITY_HUB_ENABLED_CONFIG,
+    'detective': DETECTIVE_GRAPH_CONFIG,
+    'inspector': INSPECTOR_ENABLED_CONFIG,
+    'access_analyzer': ACCESS_ANALYZER_CONFIG,
+    'config': CONFIG_RECORDER_CONFIG
+}
+_EMPTY_CONFIG = MappingProxyType({})
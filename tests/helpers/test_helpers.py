@@ -5,10 +5,24 @@ This module provides helper functions and utilities used across multiple
 test suites following SOAR testing patterns.
 """
 
-import json
-import boto3
-from unittest.mock import patch, MagicMock
-from moto import mock_aws
+from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
+from unittest.mock import MagicMock
+from botocore.exceptions import ClientError
+
+
+def freeze(value):
+    """
+    Return a read-only copy of shared test data, so no test can change it for the next.
+    
+    Dicts become read-only views and lists become tuples, recursively.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
 
 
 def mock_cross_account_session(account_id, role_name, region='us-east-1'):
@@ -83,12 +97,10 @@ def assert_log_message_contains(caplog, level, message_substring):
         level (str): Log level (INFO, WARNING, ERROR, etc.)
         message_substring (str): Substring to search for in log messages
     """
-    found = False
-    for record in caplog.records:
-        if record.levelname == level and message_substring in record.message:
-            found = True
-            break
-    
+    found = any(
+        record.levelname == level and message_substring in record.getMessage()
+        for record in caplog.records
+    )
     assert found, f"Log message containing '{message_substring}' not found at {level} level"
 
 
@@ -114,12 +126,30 @@ def assert_service_skipped_correctly(result, service_name):
     assert result is True, f"{service_name} should return True even when skipped"
 
 
+# Command-line flag for each AWS parameter
+_PARAM_FLAGS = (
+    ('--admin-account', 'admin_account'),
+    ('--security-account', 'security_account'),
+    ('--regions', 'regions'),
+    ('--cross-account-role', 'cross_account_role'),
+    ('--org-id', 'org_id'),
+    ('--root-ou', 'root_ou')
+)
+
+
+@lru_cache(maxsize=None)
+def _service_flag(service):
+    """Return the command-line flag for a service key, e.g. aws_config -> --aws-config."""
+    return f'--{service.replace("_", "-")}'
+
+
 def create_test_argv(params, service_flags, dry_run=False, verbose=False):
     """
     Create sys.argv list for testing main script argument parsing.
     
     Args:
-        params (dict): AWS parameters dictionary
+        params (dict): AWS parameters dictionary; None values are left out so the
+            script's default applies, and a regions string is passed through as-is
         service_flags (dict): Service enable/disable flags
         dry_run (bool): Enable dry run mode
         verbose (bool): Enable verbose mode
@@ -130,16 +160,15 @@ def create_test_argv(params, service_flags, dry_run=False, verbose=False):
     argv = ['setup-security-services']
     
     # Add service flags
-    for service, enabled in service_flags.items():
-        argv.extend([f'--{service.replace("_", "-")}', enabled])
+    argv += [arg for service, enabled in service_flags.items() for arg in (_service_flag(service), enabled)]
     
     # Add AWS parameters
-    argv.extend(['--admin-account', params['admin_account']])
-    argv.extend(['--security-account', params['security_account']])
-    argv.extend(['--regions', ','.join(params['regions'])])
-    argv.extend(['--cross-account-role', params['cross_account_role']])
-    argv.extend(['--org-id', params['org_id']])
-    argv.extend(['--root-ou', params['root_ou']])
+    argv += [
+        arg
+        for flag, key in _PARAM_FLAGS
+        if params[key] is not None
+        for arg in (flag, ','.join(params[key]) if isinstance(params[key], list) else params[key])
+    ]
     
     # Add optional flags
     if dry_run:
@@ -150,6 +179,41 @@ def create_test_argv(params, service_flags, dry_run=False, verbose=False):
     return argv
 
 
+# Canned responses per service and existence state: (method, 'return_value' or 'side_effect', value)
+_EXISTING_RESOURCE_MOCKS = {
+    'guardduty': {
+        True: (
+            ('list_detectors', 'return_value', {'DetectorIds': ['test-detector-123']}),
+            ('get_administrator_account', 'return_value', {'Administrator': {'AccountId': '123456789012'}}),
+        ),
+        False: (
+            ('list_detectors', 'return_value', {'DetectorIds': []}),
+            ('get_administrator_account', 'side_effect', ClientError(
+                {'Error': {'Code': 'BadRequestException'}}, 'GetAdministratorAccount'
+            )),
+        ),
+    },
+    'security_hub': {
+        True: (
+            ('describe_hub', 'return_value', {'HubArn': 'test-hub-arn'}),
+            ('list_configuration_policies', 'return_value', {
+                'ConfigurationPolicySummaryList': [
+                    {'Id': 'test-policy-1', 'Name': 'PROD-Policy'},
+                    {'Id': 'test-policy-2', 'Name': 'DEV-Policy'}
+                ]
+            }),
+        ),
+        False: (
+            ('describe_hub', 'side_effect', ClientError(
+                {'Error': {'Code': 'InvalidAccessException'}}, 'DescribeHub'
+            )),
+            ('list_configuration_policies', 'return_value', {'ConfigurationPolicySummaryList': []}),
+        ),
+    },
+    # Add more service mocking as needed
+}
+
+
 def mock_existing_aws_resources(service_name, client_mock, exists=True):
     """
     Mock existing AWS resources for testing configuration preservation.
@@ -159,43 +223,15 @@ def mock_existing_aws_resources(service_name, client_mock, exists=True):
         client_mock: Mocked AWS service client
         exists (bool): Whether resources should exist
     """
-    if service_name == 'guardduty':
-        if exists:
-            client_mock.list_detectors.return_value = {'DetectorIds': ['test-detector-123']}
-            client_mock.get_administrator_account.return_value = {
-                'Administrator': {'AccountId': '123456789012'}
-            }
-        else:
-            client_mock.list_detectors.return_value = {'DetectorIds': []}
-            from botocore.exceptions import ClientError
-            client_mock.get_administrator_account.side_effect = ClientError(
-                {'Error': {'Code': 'BadRequestException'}}, 'GetAdministratorAccount'
-            )
-    
-    elif service_name == 'security_hub':
-        if exists:
-            client_mock.describe_hub.return_value = {'HubArn': 'test-hub-arn'}
-            client_mock.list_configuration_policies.return_value = {
-                'ConfigurationPolicySummaryList': [
-                    {'Id': 'test-policy-1', 'Name': 'PROD-Policy'},
-                    {'Id': 'test-policy-2', 'Name': 'DEV-Policy'}
-                ]
-            }
-        else:
-            from botocore.exceptions import ClientError
-            client_mock.describe_hub.side_effect = ClientError(
-                {'Error': {'Code': 'InvalidAccessException'}}, 'DescribeHub'
-            )
-            client_mock.list_configuration_policies.return_value = {
-                'ConfigurationPolicySummaryList': []
-            }
-    
-    # Add more service mocking as needed
+    for method_name, attribute, value in _EXISTING_RESOURCE_MOCKS.get(service_name, {}).get(bool(exists), ()):
+        setattr(getattr(client_mock, method_name), attribute, deepcopy(value) if isinstance(value, dict) else value)
 
 
 class OutputCapture:
     """Helper class to capture and validate script output."""
     
+    __slots__ = ('stdout_lines', 'stderr_lines')
+    
     def __init__(self):
         self.stdout_lines = []
         self.stderr_lines = []
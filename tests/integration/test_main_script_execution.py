@@ -9,13 +9,18 @@ All tests use mocked AWS services for fast, reliable testing.
 import pytest
 import sys
 import os
-import subprocess
+import re
+import runpy
 from unittest.mock import patch, MagicMock
 
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+MAIN_SCRIPT = os.path.join(PROJECT_ROOT, 'setup-security-services')
+
 # Add the project root to the path to import modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, PROJECT_ROOT)
 
 from tests.fixtures.aws_parameters import create_test_params
+from tests.helpers.test_helpers import create_test_argv
 from modules.aws_config import setup_aws_config
 from modules.guardduty import setup_guardduty  
 from modules.access_analyzer import setup_access_analyzer
@@ -186,15 +191,7 @@ class TestArgumentValidation:
         ]
         
         for role in valid_roles:
-            test_args = [
-                "--admin-account", "123456789012",
-                "--security-account", "234567890123", 
-                "--regions", "us-east-1",
-                "--cross-account-role", role,
-                "--org-id", "o-example12345",
-                "--root-ou", "r-example12345",
-                "--dry-run"
-            ]
+            test_args = create_test_argv(create_test_params(cross_account_role=role), {}, dry_run=True)[1:]
             
             # This should not raise SystemExit
             try:
@@ -225,15 +222,7 @@ class TestArgumentValidation:
         ]
         
         for role in invalid_roles:
-            test_args = [
-                "--admin-account", "123456789012",
-                "--security-account", "234567890123",
-                "--regions", "us-east-1", 
-                "--cross-account-role", role,
-                "--org-id", "o-example12345",
-                "--root-ou", "r-example12345",
-                "--dry-run"
-            ]
+            test_args = create_test_argv(create_test_params(cross_account_role=role), {}, dry_run=True)[1:]
             
             # Should raise SystemExit due to invalid choice
             with pytest.raises(SystemExit):
@@ -255,19 +244,31 @@ class TestArgumentValidation:
         parser.add_argument('--dry-run', action='store_true')
         
         # Test without specifying cross-account-role (uses default)
-        test_args = [
-            "--admin-account", "123456789012",
-            "--security-account", "234567890123",
-            "--regions", "us-east-1",
-            "--org-id", "o-example12345", 
-            "--root-ou", "r-example12345",
-            "--dry-run"
-        ]
+        test_args = create_test_argv(create_test_params(cross_account_role=None), {}, dry_run=True)[1:]
         
         # Should succeed with default role
         args = parser.parse_args(test_args)
         assert args.cross_account_role == "AWSControlTowerExecution", \
             "Default cross-account role should be AWSControlTowerExecution"
+    
+    @pytest.mark.parametrize('regions', ['', '   ', '\t\t', ' \n ', '\r\n', ' , '],
+                             ids=['empty', 'spaces', 'tabs', 'mixed', 'crlf', 'blank-entries'])
+    def test_blank_regions_are_rejected(self, regions, capsys, monkeypatch):
+        """
+        GIVEN: A --regions value that is empty or contains only whitespace
+        WHEN: The main script parses its arguments
+        THEN: Should exit with code 1 and explain that a region is required
+        """
+        main = runpy.run_path(MAIN_SCRIPT, run_name='setup_security_services')['main']
+        monkeypatch.setattr(sys, 'argv', create_test_argv(create_test_params(regions=regions), {}, dry_run=True))
+        
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        
+        output = capsys.readouterr().out
+        assert exc_info.value.code == 1
+        assert "At least one region must be specified" in output
+        assert "cannot be empty or contain only whitespace" in output
 
 
 class TestMainScriptSuccessMessages:
@@ -279,8 +280,7 @@ class TestMainScriptSuccessMessages:
     only indicate the module executed without crashing.
     """
     
-    @patch('builtins.print')
-    def test_main_script_does_not_show_misleading_success_messages(self, mock_print, mock_aws_services):
+    def test_main_script_does_not_show_misleading_success_messages(self, capsys, monkeypatch):
         """
         TDD RED PHASE: This test WILL FAIL initially to expose the misleading messages.
         
@@ -291,41 +291,34 @@ class TestMainScriptSuccessMessages:
         These messages are misleading because they suggest the service is properly 
         configured when it only means the setup module didn't crash.
         """
-        # Arrange - Mock all service setup functions to return True
-        with patch('modules.aws_config.setup_aws_config', return_value=True), \
-             patch('modules.guardduty.setup_guardduty', return_value=True), \
-             patch('modules.access_analyzer.setup_access_analyzer', return_value=True), \
-             patch('modules.security_hub.setup_security_hub', return_value=True), \
-             patch('modules.detective.setup_detective', return_value=True), \
-             patch('modules.inspector.setup_inspector', return_value=True):
-            
-            # Import and execute main script logic
-            import subprocess
-            import sys
-            
-            # Run the main script with mocked services
-            result = subprocess.run([
-                sys.executable, 'setup-security-services',
-                '--admin-account', '123456789012',
-                '--security-account', '234567890123', 
-                '--regions', 'us-east-1',
-                '--org-id', 'o-example12345',
-                '--root-ou', 'r-example12345',
-                '--dry-run'
-            ], capture_output=True, text=True, cwd=os.path.join(os.path.dirname(__file__), '..', '..'))
-            
-            # Assert - Should NOT contain misleading success messages
-            all_output = result.stdout + result.stderr
-            
-            # TDD RED PHASE: These assertions will FAIL, exposing the misleading messages
-            misleading_messages = [
-                "✅ AWS Config completed successfully",
-                "✅ GuardDuty completed successfully", 
-                "✅ IAM Access Analyzer completed successfully",
-                "✅ Security Hub completed successfully",
-                "✅ Detective completed successfully",
-                "✅ Inspector completed successfully"
-            ]
-            
-            for message in misleading_messages:
-                assert message not in all_output, f"Misleading message found: '{message}' - this suggests service is properly configured when it only means module didn't crash"
\ No newline at end of file
+        # Arrange - Load the script in-process and mock all service setup functions to return True
+        main = runpy.run_path(MAIN_SCRIPT, run_name='setup_security_services')['main']
+        service_setups = {
+            name: MagicMock(return_value=True)
+            for name in ('setup_aws_config', 'setup_guardduty', 'setup_access_analyzer',
+                         'setup_security_hub', 'setup_detective', 'setup_inspector')
+        }
+        monkeypatch.setattr(sys, 'argv', create_test_argv(create_test_params(), {}, dry_run=True))
+        
+        # Act - Run the main script with mocked services
+        with patch.dict(main.__globals__, service_setups):
+            exit_code = main()
+        
+        # Assert - Should NOT contain misleading success messages
+        captured = capsys.readouterr()
+        all_output = captured.out + captured.err
+        assert exit_code == 0
+        assert all(setup.called for setup in service_setups.values()), "Every service setup should run"
+        
+        # TDD RED PHASE: These assertions will FAIL, exposing the misleading messages
+        misleading_messages = [
+            "✅ AWS Config completed successfully",
+            "✅ GuardDuty completed successfully", 
+            "✅ IAM Access Analyzer completed successfully",
+            "✅ Security Hub completed successfully",
+            "✅ Detective completed successfully",
+            "✅ Inspector completed successfully"
+        ]
+        
+        found = set(re.findall('|'.join(map(re.escape, misleading_messages)), all_output))
+        assert not found, f"Misleading messages found: {sorted(found)} - this suggests service is properly configured when it only means module didn't crash"
@@ -779,7 +779,9 @@ class TestAccessAnalyzerImprovedMessaging:
         from unittest.mock import MagicMock
         
         # Arrange - Mock delegated client with unused access analyzer
+        # (boto3 without GetFindingsStatistics, so findings are paged)
         delegated_client = MagicMock()
+        del delegated_client.get_findings_statistics
         
         # Mock list_analyzers response with unused access analyzer
         delegated_client.get_paginator.return_value.paginate.return_value = [
@@ -866,7 +868,9 @@ class TestAccessAnalyzerImprovedMessaging:
         from unittest.mock import MagicMock
         
         # Arrange - Mock delegated client with external access analyzer
+        # (boto3 without GetFindingsStatistics, so findings are paged)
         delegated_client = MagicMock()
+        del delegated_client.get_findings_statistics
         
         # Create separate paginators
         list_analyzers_paginator = MagicMock()
@@ -918,4 +922,192 @@ class TestAccessAnalyzerImprovedMessaging:
         # Should show findings count for external access analyzer
         details_text = ' '.join(status.get('service_details', []))
         assert 'Active Findings: 2' in details_text, "Should show correct findings count for external access analyzer"
-        assert 'External Access Analyzer' in details_text, "Should identify external access analyzer correctly"
\ No newline at end of file
+        assert 'External Access Analyzer' in details_text, "Should identify external access analyzer correctly"
+    
+    @patch('modules.access_analyzer.get_client')
+    def test_when_findings_statistics_available_then_findings_not_listed(self, mock_get_client, mock_aws_services):
+        """
+        GIVEN: boto3 supports GetFindingsStatistics
+        WHEN: Getting the active findings count for an analyzer
+        THEN: Should read the count from the statistics instead of paging through findings
+        """
+        from modules.access_analyzer import check_access_analyzer_in_region
+        from unittest.mock import MagicMock
+        
+        # Arrange
+        delegated_client = MagicMock()
+        list_analyzers_paginator = MagicMock()
+        list_analyzers_paginator.paginate.return_value = [
+            {
+                'analyzers': [
+                    {
+                        'name': 'ExternalAccess-ConsoleAnalyzer-test',
+                        'type': 'ORGANIZATION',
+                        'status': 'ACTIVE',
+                        'arn': 'arn:aws:access-analyzer:us-east-1:123456789012:analyzer/external-test'
+                    }
+                ]
+            }
+        ]
+        
+        def paginator_side_effect(operation):
+            if operation == 'list_analyzers':
+                return list_analyzers_paginator
+            raise Exception(f"Unexpected paginator operation: {operation}")
+        
+        delegated_client.get_paginator.side_effect = paginator_side_effect
+        delegated_client.get_findings_statistics.return_value = {
+            'findingsStatistics': [
+                {'externalAccessFindingsStatistics': {'totalActiveFindings': 7, 'totalArchivedFindings': 3}}
+            ]
+        }
+        mock_get_client.return_value = delegated_client
+        
+        # Act
+        status = check_access_analyzer_in_region(
+            region='us-east-1',
+            admin_account='111111111111',
+            security_account='222222222222',
+            cross_account_role='AWSControlTowerExecution',
+            is_main_region=True,
+            delegation_status='delegated',
+            verbose=True
+        )
+        
+        # Assert
+        delegated_client.get_findings_statistics.assert_called_with(
+            analyzerArn='arn:aws:access-analyzer:us-east-1:123456789012:analyzer/external-test'
+        )
+        details_text = ' '.join(status.get('service_details', []))
+        assert 'Active Findings: 7' in details_text, "Should count only active findings from the statistics"
+    
+    @patch('modules.access_analyzer.get_client')
+    def test_when_custom_cross_account_role_then_admin_client_uses_it(self, mock_get_client, mock_aws_services):
+        """
+        GIVEN: A cross-account role other than AWSControlTowerExecution
+        WHEN: check_access_analyzer_in_region creates its clients
+        THEN: Should assume the configured role for both admin and delegated clients
+        
+        Using one role per account lets get_client reuse a single pooled session.
+        """
+        from modules.access_analyzer import check_access_analyzer_in_region
+        
+        # Arrange
+        mock_get_client.return_value.get_paginator.return_value.paginate.return_value = [{'analyzers': []}]
+        
+        # Act
+        check_access_analyzer_in_region(
+            region='us-east-1',
+            admin_account='111111111111',
+            security_account='222222222222',
+            cross_account_role='OrganizationAccountAccessRole',
+            is_main_region=True,
+            delegation_status='delegated',
+            verbose=False
+        )
+        
+        # Assert
+        roles = {client_call.args[3] for client_call in mock_get_client.call_args_list}
+        assert roles == {'OrganizationAccountAccessRole'}, f"Expected only the configured role, got: {roles}"
+    
+    @patch('modules.access_analyzer.get_client')
+    def test_when_several_analyzers_then_each_reports_its_own_findings_count(self, mock_get_client, mock_aws_services):
+        """
+        GIVEN: Several delegated analyzers with different findings counts
+        WHEN: Their findings are counted concurrently
+        THEN: Each analyzer's details should show its own count, in listing order
+        """
+        from modules.access_analyzer import check_access_analyzer_in_region
+        from unittest.mock import MagicMock
+        
+        # Arrange
+        counts = {'arn:analyzer/external': 3, 'arn:analyzer/unused': 5}
+        delegated_client = MagicMock()
+        delegated_client.get_paginator.return_value.paginate.return_value = [
+            {
+                'analyzers': [
+                    {'name': 'ExternalAccess-test', 'type': 'ORGANIZATION', 'status': 'ACTIVE', 'arn': 'arn:analyzer/external'},
+                    {'name': 'UnusedAccess-test', 'type': 'ORGANIZATION_UNUSED_ACCESS', 'status': 'ACTIVE', 'arn': 'arn:analyzer/unused'}
+                ]
+            }
+        ]
+        delegated_client.get_findings_statistics.side_effect = lambda analyzerArn: {
+            'findingsStatistics': [{'externalAccessFindingsStatistics': {'totalActiveFindings': counts[analyzerArn]}}]
+        }
+        mock_get_client.return_value = delegated_client
+        
+        # Act
+        status = check_access_analyzer_in_region(
+            region='us-east-1',
+            admin_account='111111111111',
+            security_account='222222222222',
+            cross_account_role='AWSControlTowerExecution',
+            is_main_region=True,
+            delegation_status='delegated',
+            verbose=False
+        )
+        
+        # Assert
+        findings_lines = [detail.strip() for detail in status['service_details'] if 'Active Findings' in detail]
+        assert findings_lines[-2:] == ['Active Findings: 3', 'Active Findings: 5']
+    
+    @patch('modules.access_analyzer.get_client')
+    def test_when_delegated_to_security_account_then_admin_analyzers_not_listed(self, mock_get_client, mock_aws_services):
+        """
+        GIVEN: Access Analyzer is delegated to the Security account
+        WHEN: check_access_analyzer_in_region checks a region
+        THEN: Should only list analyzers from the delegated admin account
+        """
+        from modules.access_analyzer import check_access_analyzer_in_region
+        
+        # Arrange
+        mock_get_client.return_value.get_paginator.return_value.paginate.return_value = [{'analyzers': []}]
+        
+        # Act
+        check_access_analyzer_in_region(
+            region='us-east-1',
+            admin_account='111111111111',
+            security_account='222222222222',
+            cross_account_role='AWSControlTowerExecution',
+            is_main_region=True,
+            delegation_status='delegated',
+            verbose=False
+        )
+        
+        # Assert
+        accounts = [client_call.args[1] for client_call in mock_get_client.call_args_list]
+        assert accounts == ['222222222222'], f"Expected only the delegated admin client, got: {accounts}"
+    
+    @patch('modules.access_analyzer.get_client')
+    def test_when_delegated_admin_client_unavailable_then_admin_analyzers_listed(self, mock_get_client, mock_aws_services):
+        """
+        GIVEN: Access Analyzer is delegated but no client can be created in the Security account
+        WHEN: check_access_analyzer_in_region checks a region with an organization analyzer
+        THEN: Should fall back to the admin account's analyzers and not report a missing analyzer
+        """
+        from modules.access_analyzer import check_access_analyzer_in_region
+        from unittest.mock import MagicMock
+        
+        # Arrange
+        admin_client = MagicMock()
+        admin_client.get_paginator.return_value.paginate.return_value = [{
+            'analyzers': [{'name': 'org-analyzer', 'type': 'ORGANIZATION', 'status': 'ACTIVE'}]
+        }]
+        mock_get_client.side_effect = lambda service, account_id, region, role_name: (
+            admin_client if account_id == '111111111111' else None
+        )
+        
+        # Act
+        status = check_access_analyzer_in_region(
+            region='us-west-2',
+            admin_account='111111111111',
+            security_account='222222222222',
+            cross_account_role='AWSControlTowerExecution',
+            is_main_region=False,
+            delegation_status='delegated',
+            verbose=False
+        )
+        
+        # Assert
+        assert status['external_analyzer_count'] == 1
+        assert status['needs_changes'] is False, f"Unexpected issues: {status['issues']}"
@@ -16,7 +16,7 @@ AWS Config Setup Requirements:
 import pytest
 import sys
 import os
-from unittest.mock import patch, call, Mock, MagicMock
+from unittest.mock import patch, call, MagicMock
 
 # Add the project root to the path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -936,4 +936,58 @@ class TestDetectiveDelegationReporting:
         assert 'Detective needs changes in us-east-1' in all_output
         
         # Should provide actionable information about the errors
-        assert 'delegation' in all_output.lower() or 'permission' in all_output.lower() or 'verify' in all_output.lower()
\ No newline at end of file
+        assert 'delegation' in all_output.lower() or 'permission' in all_output.lower() or 'verify' in all_output.lower()
+
+class TestDetectiveGraphMemberListing:
+    """
+    SPECIFICATION: Detective member listing across multiple graphs
+    
+    Member listing for each graph runs concurrently but results are still
+    reported per graph, and a failing graph does not hide the others.
+    """
+    
+    @patch('modules.detective.get_client')
+    @patch('modules.detective.DelegationChecker.check_service_delegation')
+    def test_when_one_graph_member_listing_fails_then_other_graphs_still_reported(self, mock_delegation_check, mock_get_client, mock_aws_services):
+        """
+        GIVEN: Two Detective graphs in a region, one of which fails list_members
+        WHEN: check_detective_in_region lists members for both graphs
+        THEN: Should report members of the healthy graph and an error for the failing one
+        """
+        from botocore.exceptions import ClientError
+        from modules.detective import check_detective_in_region
+        
+        # Arrange
+        mock_delegation_check.return_value = {
+            'is_delegated_to_security': False,
+            'delegated_admin_account': None,
+            'delegation_check_failed': False,
+            'delegation_details': [],
+            'errors': []
+        }
+        
+        def list_members(GraphArn, **kwargs):
+            if GraphArn == 'graph-broken':
+                raise ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}}, 'ListMembers')
+            return {'MemberDetails': [{'AccountId': '111111111111', 'Status': 'ENABLED'}]}
+        
+        mock_detective_client = mock_get_client.return_value
+        mock_detective_client.list_graphs.return_value = {
+            'GraphList': [{'Arn': 'graph-ok'}, {'Arn': 'graph-broken'}]
+        }
+        mock_detective_client.list_members.side_effect = list_members
+        
+        # Act
+        result = check_detective_in_region(
+            region='us-east-1',
+            admin_account='123456789012',
+            security_account='234567890123',
+            cross_account_role='AWSControlTowerExecution',
+            verbose=False
+        )
+        
+        # Assert
+        assert result['member_count'] == 1
+        assert "      Members: 1 accounts" in result['service_details']
+        assert any('graph-broken' in error for error in result['errors']), f"Expected graph error in: {result['errors']}"
+        assert not any('graph-ok' in error for error in result['errors'])
@@ -403,6 +403,29 @@ class TestGuardDutyConfigurationScenarios:
         assert "Enable GuardDuty and create detector" in result['actions']
         assert "❌ GuardDuty not enabled - no detectors found" in result['service_details']
     
+    @patch('modules.guardduty.get_client')
+    @patch('modules.guardduty.DelegationChecker.check_service_delegation')
+    def test_when_no_detector_then_delegation_not_looked_up(self, mock_delegation_check, mock_get_client):
+        """
+        GIVEN: GuardDuty is not enabled in a region (no detectors)
+        WHEN: check_guardduty_in_region is called
+        THEN: Should return without paying for a delegation lookup it never uses
+        """
+        # Arrange
+        mock_get_client.return_value.list_detectors.return_value = {'DetectorIds': []}
+        
+        # Act
+        check_guardduty_in_region(
+            region='us-east-1',
+            admin_account='123456789012',
+            security_account='234567890123',
+            cross_account_role='AWSControlTowerExecution',
+            verbose=False
+        )
+        
+        # Assert
+        mock_delegation_check.assert_not_called()
+    
     @patch('modules.guardduty.get_client')
     def test_scenario_2_configuration_but_no_delegation(self, mock_get_client):
         """
@@ -889,8 +889,6 @@ class TestInspectorRealImplementationRequirements:
         
         This addresses the user need to understand which specific accounts have active scanning.
         """
-        import boto3
-        
         # Arrange
         params = create_test_params(regions=['us-east-1', 'us-west-2'])
         
@@ -946,8 +944,6 @@ class TestInspectorRealImplementationRequirements:
         WHEN: setup_inspector is called with enabled='No' and dry_run=True
         THEN: Should show account-specific deactivation steps in dry-run preview
         """
-        import boto3
-        
         # Arrange
         params = create_test_params(regions=['us-east-1'])
         
@@ -1131,6 +1127,55 @@ class TestInspectorDelegationReporting:
         assert any('delegation' in issue.lower() for issue in result['issues']), "Should report delegation check issue"
         assert any('delegation' in error.lower() for error in result['errors']), f"Expected delegation error in: {result['errors']}"
     
+    @patch('modules.inspector.get_client')
+    @patch('modules.inspector.DelegationChecker.check_service_delegation')
+    def test_when_scanning_status_fails_then_member_listing_is_awaited(self, mock_delegation_check, mock_get_client, mock_aws_services):
+        """
+        GIVEN: Inspector is delegated but batch_get_account_status fails
+        WHEN: check_inspector_in_region checks the region
+        THEN: Should wait for the concurrent member listing and report its error too
+        """
+        import time
+        from unittest.mock import MagicMock
+        from botocore.exceptions import ClientError
+        from modules.inspector import check_inspector_in_region
+        
+        # Arrange
+        mock_delegation_check.return_value = {
+            'is_delegated_to_security': True,
+            'delegated_admin_account': '234567890123',
+            'delegation_check_failed': False,
+            'delegation_details': [{'Id': '234567890123'}],
+            'errors': []
+        }
+        listing_finished = []
+        
+        def slow_failing_paginate(**kwargs):
+            time.sleep(0.2)
+            listing_finished.append(True)
+            raise ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'No members'}}, 'ListMembers')
+        
+        inspector_client = MagicMock()
+        inspector_client.batch_get_account_status.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'No status'}}, 'BatchGetAccountStatus'
+        )
+        inspector_client.get_paginator.return_value.paginate.side_effect = slow_failing_paginate
+        mock_get_client.return_value = inspector_client
+        
+        # Act
+        result = check_inspector_in_region(
+            region='us-west-2',
+            admin_account='123456789012',
+            security_account='234567890123',
+            cross_account_role='AWSControlTowerExecution',
+            verbose=False
+        )
+        
+        # Assert
+        assert listing_finished, "Should not return while the member listing is still running"
+        assert any('Inspector configuration check failed' in error for error in result['errors'])
+        assert any('List members failed' in error for error in result['errors']), f"Got: {result['errors']}"
+    
     @patch('modules.inspector.check_inspector_in_region')
     @patch('builtins.print')
     def test_when_delegation_check_fails_then_issue_is_reported_without_verbose(self, mock_print, mock_check_inspector, mock_aws_services):
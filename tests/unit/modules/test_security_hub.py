@@ -18,7 +18,7 @@ Security Hub Setup Requirements:
 import pytest
 import sys
 import os
-from unittest.mock import patch, call
+from unittest.mock import patch
 
 # Add the project root to the path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
@@ -62,6 +62,14 @@ class TestServiceRegionStatus:
         assert status.errors == ['Error 1']
         assert status.service_details == ['Detail 1', 'Detail 2']
     
+    def test_status_is_slotted_and_keyword_only(self):
+        """Test that status objects use slots and keyword-only construction."""
+        status = GuardDutyRegionStatus(region='us-east-1', organization_auto_enable=True)
+        
+        assert not hasattr(status, '__dict__')
+        with pytest.raises(TypeError):
+            ServiceRegionStatus('us-east-1')
+    
     def test_to_dict_conversion(self):
         """Test converting status to dictionary."""
         status = ServiceRegionStatus(
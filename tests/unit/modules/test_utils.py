@@ -14,13 +14,16 @@ Shared Utilities Requirements:
 import pytest
 import sys
 import os
+import threading
+import boto3
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
 
 # Add the project root to the path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 
-from modules.utils import printc, get_client
-from tests.fixtures.aws_parameters import create_test_params
+from modules.utils import printc, GRAY, get_client, check_regions_in_parallel, run_concurrently, iter_detective_graph_members, iter_paginated, get_region_names
 
 
 class TestSharedDelegationLogic:
@@ -91,6 +94,67 @@ class TestSharedDelegationLogic:
         assert result['delegation_check_failed'] is False, "Should not indicate check failure on success"
         assert len(result['errors']) == 0, "Should have no errors on successful check"
     
+    @patch('modules.utils.get_client')
+    def test_when_delegation_checked_for_several_regions_then_organizations_called_once(self, mock_get_client):
+        """
+        GIVEN: A service whose delegation is checked once per region
+        WHEN: check_service_delegation is called repeatedly with the same service and account
+        THEN: Should list delegated administrators only once and reuse the result
+        """
+        # Arrange
+        mock_orgs_client = MagicMock()
+        mock_orgs_client.get_paginator.return_value.paginate.return_value = [
+            {'DelegatedAdministrators': [{'Id': '234567890123'}]}
+        ]
+        mock_get_client.return_value = mock_orgs_client
+        
+        from modules.utils import DelegationChecker
+        
+        # Act
+        results = [
+            DelegationChecker.check_service_delegation(
+                'detective.amazonaws.com', '123456789012', '234567890123', [region]
+            )
+            for region in ['us-east-1', 'us-west-2', 'eu-west-1']
+        ]
+        
+        # Assert
+        assert all(result['is_delegated_to_security'] for result in results)
+        assert mock_get_client.call_count == 1, "Organizations is global, so one lookup should serve every region"
+        assert mock_orgs_client.get_paginator.return_value.paginate.call_count == 1
+
+    @patch('modules.utils.get_client')
+    def test_when_different_services_checked_concurrently_then_not_serialized(self, mock_get_client):
+        """
+        GIVEN: Delegation lookups for two different services
+        WHEN: list_delegated_admins is called for both at the same time
+        THEN: Should not hold one service's lookup behind the other's
+        """
+        # Arrange - each Organizations call waits until the other one is in flight
+        barrier = threading.Barrier(2, timeout=5)
+
+        def paginate(ServicePrincipal, **kwargs):
+            barrier.wait()
+            return [{'DelegatedAdministrators': [{'Id': '234567890123', 'ServicePrincipal': ServicePrincipal}]}]
+        mock_get_client.return_value.get_paginator.return_value.paginate.side_effect = paginate
+
+        from modules.utils import DelegationChecker
+
+        # Act
+        results = {}
+        def lookup(service_principal):
+            results[service_principal] = DelegationChecker.list_delegated_admins(service_principal, '123456789012')
+        services = ['detective.amazonaws.com', 'guardduty.amazonaws.com']
+        threads = [threading.Thread(target=lookup, args=(service,)) for service in services]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(results) == 2, "Should not wait on another service's lock"
+        assert all(results[service][0]['ServicePrincipal'] == service for service in services)
+
     @patch('modules.utils.get_client')
     def test_when_delegation_api_fails_then_error_handled_consistently(self, mock_get_client):
         """
@@ -227,8 +291,8 @@ class TestSharedDelegationLogic:
 class TestAnomalousRegionDetectionEnhancements:
     """Test enhanced anomalous region detection with account-level details."""
     
-    @patch('boto3.client')
-    def test_get_unexpected_aws_regions_eliminates_boilerplate(self, mock_boto_client):
+    @patch('modules.utils._get_base_session')
+    def test_get_unexpected_aws_regions_eliminates_boilerplate(self, mock_base_session):
         """
         GIVEN: A list of expected regions
         WHEN: get_unexpected_aws_regions is called
@@ -240,7 +304,7 @@ class TestAnomalousRegionDetectionEnhancements:
         
         # Mock EC2 client
         mock_ec2_client = MagicMock()
-        mock_boto_client.return_value = mock_ec2_client
+        mock_base_session.return_value.client.return_value = mock_ec2_client
         
         mock_ec2_client.describe_regions.return_value = {
             'Regions': [
@@ -278,7 +342,7 @@ class TestAnomalousRegionDetectionEnhancements:
         mock_ec2_client = MagicMock()
         mock_guardduty_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'guardduty':
@@ -370,7 +434,7 @@ class TestAnomalousRegionDetectionEnhancements:
         mock_ec2_client = MagicMock()
         mock_securityhub_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'securityhub':
@@ -465,7 +529,7 @@ class TestAnomalousRegionDetectionEnhancements:
         mock_ec2_client = MagicMock()
         mock_detective_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'detective':
@@ -493,24 +557,20 @@ class TestAnomalousRegionDetectionEnhancements:
         }
         
         # Mock Detective members to show account details
-        mock_paginator = MagicMock()
-        mock_detective_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [
-            {
-                'MemberDetails': [
-                    {
-                        'AccountId': '111111111111',
-                        'Status': 'ENABLED',
-                        'InvitedTime': '2024-01-15T10:30:00.000Z'
-                    },
-                    {
-                        'AccountId': '222222222222',
-                        'Status': 'ENABLED', 
-                        'InvitedTime': '2024-01-15T10:30:00.000Z'
-                    }
-                ]
-            }
-        ]
+        mock_detective_client.list_members.return_value = {
+            'MemberDetails': [
+                {
+                    'AccountId': '111111111111',
+                    'Status': 'ENABLED',
+                    'InvitedTime': '2024-01-15T10:30:00.000Z'
+                },
+                {
+                    'AccountId': '222222222222',
+                    'Status': 'ENABLED', 
+                    'InvitedTime': '2024-01-15T10:30:00.000Z'
+                }
+            ]
+        }
         
         # Act
         result = AnomalousRegionChecker.check_service_anomalous_regions(
@@ -565,7 +625,7 @@ class TestAnomalousRegionDetectionEnhancements:
         mock_ec2_client = MagicMock()
         mock_analyzer_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'accessanalyzer':
@@ -676,7 +736,7 @@ class TestAnomalousRegionChecker:
         mock_ec2_client = MagicMock()
         mock_guardduty_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'guardduty':
@@ -738,7 +798,7 @@ class TestAnomalousRegionChecker:
         mock_ec2_client = MagicMock()
         mock_guardduty_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'guardduty':
@@ -780,13 +840,12 @@ class TestAnomalousRegionChecker:
         THEN: Should handle Security Hub's unique API pattern correctly
         """
         from modules.utils import AnomalousRegionChecker
-        from botocore.exceptions import ClientError
         
         # Setup mocks
         mock_ec2_client = MagicMock()
         mock_securityhub_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'securityhub':
@@ -840,7 +899,7 @@ class TestAnomalousRegionChecker:
         mock_analyzer_client = MagicMock()
         mock_paginator = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'accessanalyzer':
@@ -900,7 +959,7 @@ class TestAnomalousRegionChecker:
         mock_ec2_client = MagicMock()
         mock_inspector_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             elif service == 'inspector2':
@@ -962,6 +1021,44 @@ class TestAnomalousRegionChecker:
                 admin_account='123456789012'
             )
     
+    def test_when_service_config_loaded_then_strategy_is_dispatchable(self):
+        """
+        GIVEN: Each supported service declares its API strategy
+        WHEN: The strategy is looked up in the dispatch table
+        THEN: Every service resolves to a resource checking function
+        """
+        from modules.utils import AnomalousRegionChecker
+
+        for service_name in ['guardduty', 'security_hub', 'detective', 'inspector', 'aws_config', 'access_analyzer']:
+            config = AnomalousRegionChecker._get_service_config(service_name)
+            assert config['strategy'] in AnomalousRegionChecker._RESOURCE_STRATEGIES, \
+                f"{service_name} strategy should be dispatchable"
+
+    def test_when_standard_strategy_called_directly_then_admin_details_added(self):
+        """
+        GIVEN: AWS Config recorders exist in a region
+        WHEN: The standard strategy is invoked directly
+        THEN: Recorders are returned with admin account details
+        """
+        from modules.utils import AnomalousRegionChecker
+
+        config_client = MagicMock()
+        config_client.describe_configuration_recorders.return_value = {
+            'ConfigurationRecorders': [{'name': 'default'}]
+        }
+        config = AnomalousRegionChecker._get_service_config('aws_config')
+
+        resources, account_details = AnomalousRegionChecker._check_standard_resources(
+            config_client, config, '123456789012'
+        )
+
+        assert resources == [{'name': 'default'}]
+        assert account_details == [{
+            'account_id': '123456789012',
+            'account_status': 'ADMIN_ACCOUNT',
+            'service_status': 'ENABLED'
+        }]
+
     @patch('modules.utils.get_client')
     def test_when_client_creation_fails_then_gracefully_continues(self, mock_get_client):
         """
@@ -974,7 +1071,7 @@ class TestAnomalousRegionChecker:
         # Setup mocks - EC2 succeeds, service client fails
         mock_ec2_client = MagicMock()
         
-        def mock_client_factory(service, account_id, region, role_name):
+        def mock_client_factory(service, account_id, region, role_name, config=None):
             if service == 'ec2':
                 return mock_ec2_client
             else:
@@ -1001,6 +1098,191 @@ class TestAnomalousRegionChecker:
         # Assert - Should handle gracefully and return empty list
         assert len(result) == 0
 
+    @patch('modules.utils.get_client')
+    def test_when_anomalous_regions_probed_then_fail_fast_client_config_used(self, mock_get_client):
+        """
+        GIVEN: Detective graphs exist in two unexpected regions
+        WHEN: check_service_anomalous_regions probes the unexpected regions
+        THEN: Both regions are reported and every probe client uses the fail-fast config
+        """
+        from modules.utils import AnomalousRegionChecker, PROBE_CLIENT_CONFIG
+
+        mock_ec2_client = MagicMock()
+        mock_detective_client = MagicMock()
+
+        def mock_client_factory(service, account_id, region, role_name, config=None):
+            if service == 'ec2':
+                return mock_ec2_client
+            return mock_detective_client
+
+        mock_get_client.side_effect = mock_client_factory
+
+        mock_ec2_client.describe_regions.return_value = {
+            'Regions': [
+                {'RegionName': 'us-east-1'},
+                {'RegionName': 'eu-west-1'},
+                {'RegionName': 'ap-south-1'}
+            ]
+        }
+        mock_detective_client.list_graphs.return_value = {
+            'GraphList': [{'Arn': 'arn:aws:detective:eu-west-1:123456789012:graph:abc'}]
+        }
+        mock_detective_client.list_members.return_value = {'MemberDetails': []}
+
+        # Act
+        anomalies = AnomalousRegionChecker.check_service_anomalous_regions(
+            service_name='detective',
+            expected_regions=['us-east-1'],
+            admin_account='123456789012',
+            security_account='234567890123'
+        )
+
+        # Assert
+        assert [anomaly.region for anomaly in anomalies] == ['eu-west-1', 'ap-south-1']
+        probe_calls = [c for c in mock_get_client.call_args_list if c.args[0] == 'detective']
+        assert probe_calls and all(c.kwargs.get('config') is PROBE_CLIENT_CONFIG for c in probe_calls)
+
+    @patch('modules.utils.get_client')
+    def test_when_region_unsupported_then_cached_and_skipped_on_next_run(self, mock_get_client):
+        """
+        GIVEN: The service reports UnsupportedOperation in an unexpected region
+        WHEN: The anomaly scan runs, the cache is saved, and the scan runs again
+        THEN: The region is not probed a second time for that account
+        """
+        import modules.utils
+        from modules.utils import AnomalousRegionChecker, save_unreachable_cache, clear_unreachable_cache
+        from botocore.exceptions import ClientError
+
+        mock_ec2_client = MagicMock()
+        mock_guardduty_client = MagicMock()
+
+        def mock_client_factory(service, account_id, region, role_name, config=None):
+            if service == 'ec2':
+                return mock_ec2_client
+            return mock_guardduty_client
+
+        mock_get_client.side_effect = mock_client_factory
+
+        mock_ec2_client.describe_regions.return_value = {
+            'Regions': [
+                {'RegionName': 'us-east-1'},
+                {'RegionName': 'me-south-1'}
+            ]
+        }
+        mock_guardduty_client.list_detectors.side_effect = ClientError(
+            {'Error': {'Code': 'UnsupportedOperation', 'Message': 'Not available'}}, 'ListDetectors'
+        )
+
+        def scan(admin_account='123456789012'):
+            return AnomalousRegionChecker.check_service_anomalous_regions(
+                service_name='guardduty',
+                expected_regions=['us-east-1'],
+                admin_account=admin_account
+            )
+
+        # Act - First run probes the region and persists the result
+        assert scan() == []
+        assert mock_guardduty_client.list_detectors.call_count == 1
+        save_unreachable_cache()
+
+        # Simulate a new process reading the cache from disk
+        modules.utils._unreachable_cache = None
+        assert scan() == []
+
+        # Assert - Region was skipped on the second run
+        assert mock_guardduty_client.list_detectors.call_count == 1
+
+        # Another account's region is still probed
+        scan(admin_account='999999999999')
+        assert mock_guardduty_client.list_detectors.call_count == 2
+
+        # Clearing the cache makes the region eligible for probing again
+        clear_unreachable_cache()
+        scan()
+        assert mock_guardduty_client.list_detectors.call_count == 3
+
+    @patch('modules.utils.get_client')
+    def test_when_endpoint_connection_fails_then_region_not_cached(self, mock_get_client):
+        """
+        GIVEN: The service endpoint cannot be reached in an unexpected region
+        WHEN: The anomaly scan runs twice
+        THEN: The connection failure is not remembered and the region is probed again
+        """
+        from modules.utils import AnomalousRegionChecker, save_unreachable_cache
+        from botocore.exceptions import EndpointConnectionError
+
+        mock_ec2_client = MagicMock()
+        mock_guardduty_client = MagicMock()
+
+        def mock_client_factory(service, account_id, region, role_name, config=None):
+            if service == 'ec2':
+                return mock_ec2_client
+            return mock_guardduty_client
+
+        mock_get_client.side_effect = mock_client_factory
+
+        mock_ec2_client.describe_regions.return_value = {
+            'Regions': [
+                {'RegionName': 'us-east-1'},
+                {'RegionName': 'me-south-1'}
+            ]
+        }
+        mock_guardduty_client.list_detectors.side_effect = EndpointConnectionError(
+            endpoint_url='https://guardduty.me-south-1.amazonaws.com/'
+        )
+
+        for _ in range(2):
+            assert AnomalousRegionChecker.check_service_anomalous_regions(
+                service_name='guardduty',
+                expected_regions=['us-east-1'],
+                admin_account='123456789012'
+            ) == []
+        save_unreachable_cache()
+
+        assert mock_guardduty_client.list_detectors.call_count == 2
+
+    def test_when_cache_entry_expired_then_region_probed_again(self):
+        """
+        GIVEN: An unreachable region cached on disk more than a day ago
+        WHEN: The cache is loaded by a new process
+        THEN: The expired entry is dropped and a recent one is kept
+        """
+        import json
+        import time
+        import modules.utils
+        from modules.utils import is_region_unreachable, UNREACHABLE_CACHE_TTL_SECONDS
+
+        now = time.time()
+        with open(modules.utils.UNREACHABLE_CACHE_FILE, 'w') as f:
+            json.dump([
+                ['123456789012', 'guardduty', 'me-south-1', now - UNREACHABLE_CACHE_TTL_SECONDS - 1],
+                ['123456789012', 'detective', 'me-south-1', now - 60]
+            ], f)
+
+        assert is_region_unreachable('123456789012', 'guardduty', 'me-south-1') is False
+        assert is_region_unreachable('123456789012', 'detective', 'me-south-1') is True
+
+    def test_when_error_classified_then_error_code_is_used_not_message_text(self):
+        """
+        GIVEN: ClientErrors with various codes and messages
+        WHEN: They are classified as unreachable or not
+        THEN: Only the structured error code decides, not the message wording
+        """
+        from modules.utils import _is_unreachable_error
+        from botocore.exceptions import ClientError, EndpointConnectionError
+
+        unsupported = ClientError(
+            {'Error': {'Code': 'UnsupportedOperation', 'Message': 'Not available'}}, 'ListDetectors'
+        )
+        access_denied = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'UnsupportedOperation mentioned'}}, 'ListDetectors'
+        )
+
+        assert _is_unreachable_error(unsupported) is True
+        assert _is_unreachable_error(access_denied) is False
+        assert _is_unreachable_error(EndpointConnectionError(endpoint_url='https://example.com')) is False
+        assert _is_unreachable_error(ValueError('Could not connect to the endpoint URL')) is False
+
 
 class TestExistingUtilities:
     """
@@ -1027,8 +1309,8 @@ class TestExistingUtilities:
             assert "\033[K" in call_args, "Should include line clearing"
             assert "\033[0m" in call_args, "Should include color reset"
     
-    @patch('boto3.client')
-    def test_when_get_client_called_then_cross_account_client_created(self, mock_boto_client):
+    @patch('modules.utils._get_base_session')
+    def test_when_get_client_called_then_cross_account_client_created(self, mock_base_session):
         """
         GIVEN: Need to create cross-account AWS client
         WHEN: get_client is called with account and role details
@@ -1036,14 +1318,16 @@ class TestExistingUtilities:
         """
         # Arrange
         mock_sts_client = MagicMock()
-        mock_service_client = MagicMock()
-        mock_boto_client.side_effect = [mock_sts_client, mock_service_client]
+        base_session = boto3.Session()
+        base_session.client = MagicMock(return_value=mock_sts_client)
+        mock_base_session.return_value = base_session
         
         mock_sts_client.assume_role.return_value = {
             'Credentials': {
                 'AccessKeyId': 'test-key',
                 'SecretAccessKey': 'test-secret',
-                'SessionToken': 'test-token'
+                'SessionToken': 'test-token',
+                'Expiration': datetime.now(timezone.utc) + timedelta(hours=1)
             }
         }
         
@@ -1055,4 +1339,231 @@ class TestExistingUtilities:
         mock_sts_client.assume_role.assert_called_once()
         role_arn = mock_sts_client.assume_role.call_args[1]['RoleArn']
         assert '234567890123' in role_arn, "Should use correct account ID in role ARN"
-        assert 'AWSControlTowerExecution' in role_arn, "Should use correct role name"
\ No newline at end of file
+        assert 'AWSControlTowerExecution' in role_arn, "Should use correct role name"
+
+    @patch('modules.utils._get_base_session')
+    def test_when_get_client_called_repeatedly_then_role_assumed_once(self, mock_base_session):
+        """
+        GIVEN: Clients needed for several services and regions in one account
+        WHEN: get_client is called for each of them with the same role
+        THEN: Should assume the role once and reuse the pooled session
+        """
+        # Arrange
+        mock_sts_client = MagicMock()
+        base_session = boto3.Session()
+        base_session.client = MagicMock(return_value=mock_sts_client)
+        mock_base_session.return_value = base_session
+        mock_sts_client.assume_role.return_value = {
+            'Credentials': {
+                'AccessKeyId': 'test-key',
+                'SecretAccessKey': 'test-secret',
+                'SessionToken': 'test-token',
+                'Expiration': datetime.now(timezone.utc) + timedelta(hours=1)
+            }
+        }
+        
+        # Act
+        clients = [
+            get_client('guardduty', '234567890123', region, 'AWSControlTowerExecution')
+            for region in ['us-east-1', 'us-west-2', 'eu-west-1']
+        ]
+        clients.append(get_client('detective', '234567890123', 'us-east-1', 'AWSControlTowerExecution'))
+        
+        # Assert
+        assert all(client is not None for client in clients), "Should return configured clients"
+        assert mock_sts_client.assume_role.call_count == 1, "Should assume the role only once"
+        assert base_session.client.call_args[0] == ('sts',)
+        assert base_session.client.call_args[1]['region_name'] == 'us-east-1', "Should use the regional STS endpoint"
+        assert base_session.client.call_args[1]['config'].retries['max_attempts'] <= 3, "Should fail fast on STS"
+        assert clients[1].meta.region_name == 'us-west-2', "Should honour the requested region"
+        assert clients[0].meta.region_name == 'us-east-1'
+        assert clients[0].meta.config.retries['mode'] == 'adaptive', "Should use the shared client config"
+        assert clients[0].meta.config.max_pool_connections == 50
+        
+        import modules.utils
+        role_session = modules.utils._role_session_pool[('234567890123', 'AWSControlTowerExecution')]
+        assert role_session._session.get_component('data_loader') is modules.utils._data_loader, \
+            "Should share loaded service models across sessions"
+        assert role_session.get_credentials().access_key == 'test-key', "Should use the assumed role's credentials"
+
+    @patch('modules.utils._get_base_session')
+    def test_when_different_roles_assumed_concurrently_then_not_serialized(self, mock_base_session):
+        """
+        GIVEN: Workers needing clients in two different accounts at the same time
+        WHEN: get_client is called for both from separate threads
+        THEN: Should assume both roles concurrently rather than one after the other
+        """
+        # Arrange - each AssumeRole call waits until the other one is in flight
+        mock_sts_client = MagicMock()
+        base_session = boto3.Session()
+        base_session.client = MagicMock(return_value=mock_sts_client)
+        mock_base_session.return_value = base_session
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def assume_role(**kwargs):
+            barrier.wait()
+            return {
+                'Credentials': {
+                    'AccessKeyId': 'test-key',
+                    'SecretAccessKey': 'test-secret',
+                    'SessionToken': 'test-token',
+                    'Expiration': datetime.now(timezone.utc) + timedelta(hours=1)
+                }
+            }
+        mock_sts_client.assume_role.side_effect = assume_role
+        
+        # Act
+        results = {}
+        def create(account_id):
+            results[account_id] = get_client('guardduty', account_id, 'us-east-1', 'AWSControlTowerExecution')
+        threads = [threading.Thread(target=create, args=(account_id,)) for account_id in ['111111111111', '222222222222']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # Assert
+        assert all(client is not None for client in results.values()), "Should not wait on another role's lock"
+        assert len(results) == 2
+
+    def test_when_regions_checked_in_parallel_then_results_keep_region_order(self):
+        """
+        GIVEN: Several regions to check
+        WHEN: check_regions_in_parallel runs without verbose output
+        THEN: Should run the checks concurrently and return them in region order
+        """
+        # Arrange - every check waits until all three are running at once
+        regions = ['us-east-1', 'us-west-2', 'eu-west-1']
+        barrier = threading.Barrier(len(regions), timeout=5)
+        
+        def check_region(region):
+            barrier.wait()
+            return {'region': region}
+        
+        # Act
+        results = check_regions_in_parallel(check_region, regions)
+        
+        # Assert
+        assert list(results) == regions, "Should preserve region order"
+        assert all(results[region]['region'] == region for region in regions)
+    
+    def test_when_regions_checked_in_parallel_then_output_grouped_by_region(self, capsys):
+        """
+        GIVEN: Region checks that print while running concurrently
+        WHEN: check_regions_in_parallel is called
+        THEN: Should write each region's output together, in region order
+        """
+        # Arrange - both checks are running before either prints its second line
+        regions = ['us-east-1', 'us-west-2']
+        barrier = threading.Barrier(len(regions), timeout=5)
+        
+        def check_region(region):
+            printc(GRAY, f"start {region}")
+            barrier.wait()
+            printc(GRAY, f"end {region}")
+            return {'region': region}
+        
+        # Act
+        results = check_regions_in_parallel(check_region, regions)
+        
+        # Assert
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+        assert [line.split()[-1].split('\033')[0] for line in lines] == [
+            'us-east-1', 'us-east-1', 'us-west-2', 'us-west-2'
+        ], "Should not interleave output from different regions"
+        assert list(results) == regions
+    
+    def test_when_work_run_concurrently_then_output_stays_with_region(self, capsys):
+        """
+        GIVEN: A region check that prints from a helper thread
+        WHEN: The helper is started with run_concurrently
+        THEN: Should return the helper's result and keep its output in the region's block
+        """
+        # Arrange
+        def check_region(region):
+            future = run_concurrently(printc, GRAY, f"helper {region}")
+            future.result()
+            printc(GRAY, f"done {region}")
+            return {'region': region}
+        
+        # Act
+        check_regions_in_parallel(check_region, ['us-east-1', 'us-west-2'])
+        
+        # Assert
+        lines = [line.split('\033')[1][4:] for line in capsys.readouterr().out.splitlines() if line]
+        assert lines == ['helper us-east-1', 'done us-east-1', 'helper us-west-2', 'done us-west-2']
+    
+    def test_when_detective_members_span_pages_then_next_token_followed(self):
+        """
+        GIVEN: A Detective graph whose members span two pages
+        WHEN: iter_detective_graph_members is consumed
+        THEN: Should follow NextToken with the maximum page size and return all members
+        """
+        # Arrange - Detective list_members has no boto3 paginator
+        mock_detective_client = MagicMock()
+        mock_detective_client.list_members.side_effect = [
+            {'MemberDetails': [{'AccountId': '111111111111'}], 'NextToken': 'page-2'},
+            {'MemberDetails': [{'AccountId': '222222222222'}]}
+        ]
+        
+        # Act
+        members = list(iter_detective_graph_members(mock_detective_client, 'graph-arn'))
+        
+        # Assert
+        assert [m['AccountId'] for m in members] == ['111111111111', '222222222222']
+        first_call, second_call = mock_detective_client.list_members.call_args_list
+        assert first_call.kwargs == {'GraphArn': 'graph-arn', 'MaxResults': 200}
+        assert second_call.kwargs == {'GraphArn': 'graph-arn', 'MaxResults': 200, 'NextToken': 'page-2'}
+    
+    def test_when_iter_paginated_consumed_then_items_yielded_page_by_page(self):
+        """
+        GIVEN: A paginator returning several pages
+        WHEN: iter_paginated is consumed only partially
+        THEN: Should yield items lazily without requesting pages it does not need
+        """
+        # Arrange
+        pages_requested = []
+        
+        def pages(**kwargs):
+            for number in (1, 2, 3):
+                pages_requested.append(number)
+                yield {'Members': [{'AccountId': f'{number}' * 12}]}
+        
+        mock_paginator = MagicMock()
+        mock_paginator.paginate.side_effect = pages
+        
+        # Act
+        items = iter_paginated(mock_paginator, 'Members', DetectorId='detector-1')
+        first = next(items)
+        
+        # Assert
+        assert first == {'AccountId': '111111111111'}
+        assert pages_requested == [1], "Should only have fetched the first page"
+        assert [item['AccountId'] for item in items] == ['222222222222', '333333333333']
+        mock_paginator.paginate.assert_called_once_with(DetectorId='detector-1')
+    
+    def test_when_region_list_cached_then_describe_regions_skipped_until_stale(self):
+        """
+        GIVEN: Region names fetched once for an account
+        WHEN: get_region_names is called again within and after the cache lifetime
+        THEN: Should reuse the cached list and only call DescribeRegions again once stale
+        """
+        import modules.utils
+        
+        # Arrange
+        mock_ec2_client = MagicMock()
+        mock_ec2_client.describe_regions.return_value = {
+            'Regions': [{'RegionName': 'us-east-1'}, {'RegionName': 'eu-west-1'}]
+        }
+        create_client = MagicMock(return_value=mock_ec2_client)
+        
+        # Act
+        first = get_region_names('123456789012', create_client)
+        second = get_region_names('123456789012', create_client)
+        with patch('modules.utils.time.time', return_value=time.time() + modules.utils.REGIONS_CACHE_TTL_SECONDS + 1):
+            third = get_region_names('123456789012', create_client)
+        
+        # Assert
+        assert first == second == third == ['us-east-1', 'eu-west-1']
+        assert create_client.call_count == 2, "Should only build a client on a cache miss"
+        assert mock_ec2_client.describe_regions.call_count == 2
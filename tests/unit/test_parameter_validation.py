@@ -6,17 +6,15 @@ and parameter handling logic.
 """
 
 import pytest
-import argparse
 import sys
 import os
-from unittest.mock import patch
 
 # Add the project root to the path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from tests.fixtures.aws_parameters import (
     VALID_ACCOUNT_IDS, VALID_REGIONS, VALID_ORG_IDS, VALID_ROOT_OUS,
-    INVALID_ACCOUNT_IDS, INVALID_REGIONS, INVALID_ORG_IDS
+    INVALID_ACCOUNT_IDS
 )
 
 